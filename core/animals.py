@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Any
 
 from environs import env
@@ -5,6 +6,7 @@ from hikari import Embed
 from loguru import logger
 
 from core.formatters import response
+from core.prefetch import Prefetch, Provider
 from core.utils import get
 
 
@@ -184,7 +186,8 @@ async def some_random_api(animal: str) -> Embed | None:
     try:
         image_url: str = data["image"]
 
-        # April 27th, 2025: some_random_api CDN has been broken for weeks
+        # April 27th, 2025: some_random_api CDN has been broken for weeks,
+        # these payloads are reported as invalid to the source health score
         if "cdn.some-random-api.com" not in image_url:
             return response(image=image_url)
     except Exception as e:
@@ -293,3 +296,33 @@ async def the_dog_api() -> Embed | None:
         return response(title=name, fields=facts, image=dog["url"])
     except Exception as e:
         logger.opt(exception=e).error("Failed to fetch from the_dog_api")
+
+
+# Sources available for each animal type, keyed by provider name
+animalSources: dict[str, dict[str, Provider]] = {
+    "Bird": {
+        "some_random_api": partial(some_random_api, "bird"),
+        "random_duk": random_duk,
+    },
+    "Bunny": {"bunnies_io": bunnies_io},
+    "Cat": {
+        "some_random_api": partial(some_random_api, "cat"),
+        "the_cat_api": the_cat_api,
+        "cataas": cataas,
+    },
+    "Dog": {
+        "some_random_api": partial(some_random_api, "dog"),
+        "the_dog_api": the_dog_api,
+        "dog_ceo": dog_ceo,
+        "random_dog": random_dog,
+    },
+    "Duck": {"random_duk": random_duk},
+    "Fox": {
+        "some_random_api": partial(some_random_api, "fox"),
+        "random_fox": random_fox,
+    },
+    "Lizard": {"nekos_life": nekos_life},
+    "Panda": {"some_random_api": partial(some_random_api, "panda")},
+    "Red Panda": {"some_random_api": partial(some_random_api, "red_panda")},
+}
+animalPrefetch: Prefetch = Prefetch("animal", animalSources)
@@ -0,0 +1,54 @@
+import re
+from re import Pattern
+from typing import Self
+
+from loguru import logger
+from urlextract import URLExtract  # type: ignore
+
+
+class Archives:
+    """
+    Scanner for Zeppelin log archive URLs in message content.
+
+    Content is only passed to the URL extractor once a cheap substring check
+    finds the archive host, so messages without an archive cost a single
+    scan.
+    """
+
+    # Substring present in every archive URL
+    marker: str = "api.zeppelin.gg/archives/"
+
+    # Archive URL, capturing the archive ID
+    pattern: Pattern[str] = re.compile(
+        r"https://api\.zeppelin\.gg/archives/(?P<id>[\w-]+)"
+    )
+
+    def __init__(self: Self) -> None:
+        """Build the URL extractor, which loads and compiles the TLD list."""
+
+        self.extractor: URLExtract = URLExtract()
+
+        logger.debug("Built Zeppelin archive URL extractor")
+
+    def find(self: Self, content: str) -> list[tuple[str, str]]:
+        """Return the unique (url, archive ID) pairs in the provided content."""
+
+        content = content.lower()
+
+        if Archives.marker not in content:
+            return []
+
+        results: dict[str, str] = {}
+
+        for url in self.extractor.find_urls(content, True):
+            if not isinstance(url, str):
+                logger.debug(
+                    f"Skipping URL {url}, recieved {type(url)} expected string"
+                )
+
+                continue
+
+            if match := Archives.pattern.match(url):
+                results[url] = match.group("id")
+
+        return list(results.items())
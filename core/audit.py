@@ -0,0 +1,178 @@
+import asyncio
+from asyncio import Event, Task
+from typing import Self
+
+from hikari import RESTAware
+from hikari.errors import RateLimitTooLongError
+from loguru import logger
+
+
+class Audit:
+    """
+    Queue of log lines for Discord log channels.
+
+    Lines are accepted without blocking and written in the background,
+    coalesced into as few messages per channel as the message length limit
+    allows.
+    """
+
+    # Discord limitation is 2,000 characters per message
+    # https://discord.com/developers/docs/resources/message#create-message-jsonform-params
+    limit: int = 2000
+
+    # Rate limited attempts to write a single message
+    retries: int = 3
+
+    def __init__(self: Self, window: float = 2.0, timeout: float = 10.0) -> None:
+        """
+        Initialize an empty queue which is flushed at most once per window
+        seconds, and drained within timeout seconds upon stopping.
+        """
+
+        self.window: float = window
+        self.timeout: float = timeout
+        self.queues: dict[int, list[str]] = {}
+        self.app: RESTAware | None = None
+        self.wake: Event = Event()
+        self.task: Task[None] | None = None
+        self.flushing: bool = False
+        self.closing: bool = False
+
+    def start(self: Self, app: RESTAware) -> None:
+        """Begin writing queued lines using the provided REST application."""
+
+        if self.task:
+            return
+
+        self.app = app
+        self.closing = False
+        self.task = asyncio.create_task(self.run())
+
+        logger.debug(f"Started audit log writer (window: {self.window:,}s)")
+
+    async def stop(self: Self) -> None:
+        """Cancel the background writer and write any remaining lines."""
+
+        if not self.task:
+            return
+
+        self.closing = True
+
+        # Never interrupt a flush, lines in flight would be lost
+        if not self.flushing:
+            self.task.cancel()
+
+        try:
+            async with asyncio.timeout(self.timeout):
+                await asyncio.wait({self.task})
+                await self.flush()
+        except TimeoutError:
+            logger.warning(f"Audit log writer failed to drain within {self.timeout:,}s")
+
+        # Interrupt a flush which exceeded the timeout, logging what it dropped
+        self.task.cancel()
+
+        await asyncio.wait({self.task})
+
+        self.task = None
+
+        if dropped := sum(len(lines) for lines in self.queues.values()):
+            logger.warning(f"Dropped {dropped:,} queued audit log lines")
+
+        self.queues = {}
+
+        logger.debug("Stopped audit log writer")
+
+    def write(self: Self, channel_id: int, line: str) -> None:
+        """Queue a line to be written to the specified channel."""
+
+        if len(line) > Audit.limit:
+            line = line[: Audit.limit - 3] + "..."
+
+        self.queues.setdefault(channel_id, []).append(line)
+        self.wake.set()
+
+    def batch(self: Self, lines: list[str]) -> list[str]:
+        """Join lines into as few messages as the length limit allows."""
+
+        results: list[str] = []
+        current: str = ""
+
+        for line in lines:
+            if not current:
+                current = line
+            elif len(current) + 1 + len(line) <= Audit.limit:
+                current += f"\n{line}"
+            else:
+                results.append(current)
+
+                current = line
+
+        if current:
+            results.append(current)
+
+        return results
+
+    async def send(self: Self, channel_id: int, content: str) -> None:
+        """Write a single message, waiting out a limited number of rate limits."""
+
+        if not self.app:
+            raise RuntimeError("audit log writer is not started")
+
+        for attempt in range(1, Audit.retries + 1):
+            try:
+                await self.app.rest.create_message(channel_id, content)
+
+                return
+            except RateLimitTooLongError as e:
+                if attempt >= Audit.retries:
+                    raise
+
+                logger.debug(
+                    f"Audit log writes to channel {channel_id} rate limited, waiting {e.retry_after:,.2f}s"
+                )
+
+                await asyncio.sleep(e.retry_after)
+
+    async def flush(self: Self) -> None:
+        """Write all queued lines."""
+
+        queues: dict[int, list[str]] = self.queues
+        self.queues = {}
+        self.flushing = True
+
+        pending: dict[int, list[str]] = {
+            channel_id: self.batch(lines) for channel_id, lines in queues.items()
+        }
+
+        try:
+            for channel_id, batches in pending.items():
+                while batches:
+                    try:
+                        await self.send(channel_id, batches[0])
+                    except Exception as e:
+                        logger.opt(exception=e).error(
+                            f"Failed to write audit log to channel {channel_id}, dropped message"
+                        )
+
+                    batches.pop(0)
+        except asyncio.CancelledError:
+            if dropped := sum(len(batches) for batches in pending.values()):
+                logger.warning(f"Dropped {dropped:,} unwritten audit log messages")
+
+            raise
+        finally:
+            self.flushing = False
+
+    async def run(self: Self) -> None:
+        """Flush queued lines whenever lines are written, once per window."""
+
+        while not self.closing:
+            await self.wake.wait()
+
+            # Allow lines written in quick succession to coalesce
+            await asyncio.sleep(self.window)
+
+            self.wake.clear()
+
+            await self.flush()
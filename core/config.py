@@ -26,15 +26,43 @@ class Config:
         self.channels: dict[str, int] = self.values["channels"]
 
         self.logs_keywords: list[str] = self.values["logs"]["keywords"]
-        self.logs_ignore_channels: list[int] = self.values["logs"]["ignoreChannels"]
-        self.logs_mentions: list[int] = self.values["logs"]["mentions"]
+        self.logs_ignore_channels: frozenset[int] = frozenset(
+            self.values["logs"]["ignoreChannels"]
+        )
+        self.logs_mentions: frozenset[int] = frozenset(self.values["logs"]["mentions"])
+        self.logs_history: int = self.values["logs"].get("history", 100)
+        self.logs_archive_limit: int = self.values["logs"].get(
+            "archiveLimit", 10 * 1024 * 1024
+        )
 
-        self.roles_require: list[int] = self.values["roles"]["require"]
-        self.roles_allow: list[int] = self.values["roles"]["allow"]
+        self.roles_require: frozenset[int] = frozenset(self.values["roles"]["require"])
+        self.roles_allow: frozenset[int] = frozenset(self.values["roles"]["allow"])
         self.roles_vip: int = self.values["roles"]["vip"]
+        self.roles_mode: str = self.values["roles"].get("mode", "message")
+
+        # Any other mode would silently disable role validation
+        if self.roles_mode not in ("message", "member"):
+            logger.error(
+                f"Invalid role validation mode {self.roles_mode}, defaulting to message"
+            )
+
+            self.roles_mode = "message"
 
         self.forums_server: int = self.values["forums"]["server"]
         self.forums_lifetime: int = self.values["forums"]["lifetime"]
-        self.forums_immune: list[int] = self.values["forums"]["immune"]
+        self.forums_immune: frozenset[int] = frozenset(self.values["forums"]["immune"])
         self.forums_channels: list[int] = self.values["forums"]["channels"]
         self.forums_greeting: str = self.values["forums"]["greeting"]
+        self.forums_database: str = self.values["forums"].get("database", "threads.db")
+
+        reddit: dict[str, Any] = self.values.get("reddit", {})
+
+        self.reddit_interval: int = reddit.get("interval", 300)
+        self.reddit_spike: int = reddit.get("spike", 25)
+
+        prefetch: dict[str, Any] = self.values.get("prefetch", {})
+
+        self.prefetch_size: int = prefetch.get("size", 3)
+        self.prefetch_watermark: int = prefetch.get("watermark", 1)
+        self.prefetch_hedge: float = prefetch.get("hedge", 0.5)
+        self.prefetch_deadline: float = prefetch.get("deadline", 5.0)
@@ -0,0 +1,99 @@
+import asyncio
+import heapq
+import time
+from asyncio import Event
+from typing import Self
+
+
+class Deadlines:
+    """
+    Min-heap of keys ordered by the UNIX timestamp at which they are due.
+
+    Rescheduled and cancelled keys are discarded lazily as they reach the
+    top of the heap, so every operation is O(log n).
+    """
+
+    def __init__(self: Self) -> None:
+        """Initialize an empty schedule."""
+
+        self.heap: list[tuple[float, int]] = []
+        self.due: dict[int, float] = {}
+        self.wake: Event = Event()
+
+    def __len__(self: Self) -> int:
+        """Return the number of scheduled keys."""
+
+        return len(self.due)
+
+    def __contains__(self: Self, key: int) -> bool:
+        """Determine whether the provided key is scheduled."""
+
+        return key in self.due
+
+    def schedule(self: Self, key: int, when: float) -> None:
+        """Schedule a key to be due at the provided timestamp."""
+
+        if self.due.get(key) == when:
+            return
+
+        self.due[key] = when
+
+        heapq.heappush(self.heap, (when, key))
+
+        # Only wake the waiter if the next deadline moved earlier
+        if self.heap[0] == (when, key):
+            self.wake.set()
+
+    def cancel(self: Self, key: int) -> None:
+        """Remove a key from the schedule, if scheduled."""
+
+        self.due.pop(key, None)
+
+    def clear(self: Self) -> None:
+        """Remove all keys from the schedule."""
+
+        self.heap.clear()
+        self.due.clear()
+
+    def peek(self: Self) -> float | None:
+        """Return the timestamp of the next deadline, if any."""
+
+        while self.heap:
+            when, key = self.heap[0]
+
+            if self.due.get(key) == when:
+                return when
+
+            heapq.heappop(self.heap)
+
+    async def wait(self: Self) -> list[int]:
+        """Wait until at least one key is due, then return all due keys."""
+
+        while True:
+            self.wake.clear()
+
+            if (when := self.peek()) is None:
+                await self.wake.wait()
+
+                continue
+
+            if (delay := when - time.time()) > 0:
+                try:
+                    async with asyncio.timeout(delay):
+                        await self.wake.wait()
+                except TimeoutError:
+                    pass
+
+                continue
+
+            results: list[int] = []
+            now: float = time.time()
+
+            while (when := self.peek()) is not None and when <= now:
+                _, key = heapq.heappop(self.heap)
+
+                del self.due[key]
+
+                results.append(key)
+
+            return results
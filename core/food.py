@@ -1,9 +1,11 @@
+from functools import partial
 from typing import Any
 
 from hikari import Embed
 from loguru import logger
 
 from core.formatters import response
+from core.prefetch import Prefetch, Provider
 from core.utils import get
 
 
@@ -27,3 +29,15 @@ async def foodish(food: str) -> Embed | None:
         return response(image=data["image"])
     except Exception as e:
         logger.opt(exception=e).error(f"Failed to fetch food {food} from foodish")
+
+
+# Sources available for each food type, keyed by provider name
+foodSources: dict[str, dict[str, Provider]] = {
+    "Burger": {"foodish": partial(foodish, "burger")},
+    "Chicken": {"foodish": partial(foodish, "butter-chicken")},
+    "Dessert": {"foodish": partial(foodish, "dessert")},
+    "Pasta": {"foodish": partial(foodish, "pasta")},
+    "Pizza": {"foodish": partial(foodish, "pizza")},
+    "Rice": {"foodish": partial(foodish, "rice")},
+}
+foodPrefetch: Prefetch = Prefetch("food", foodSources)
@@ -3,7 +3,8 @@ import random
 import string
 from datetime import datetime
 from enum import StrEnum
-from typing import Any
+from itertools import product
+from typing import Any, Hashable
 
 from arc import (
     GatewayClient,
@@ -30,6 +31,14 @@ from hikari import (
 )
 from loguru import logger
 
+from core.lru import LRU
+
+# Entities resolved via REST, keyed by (kind, id)
+entities: LRU = LRU(2048, 600.0)
+
+# Expanded entity strings, keyed by (kind, id, format, show_id)
+expansions: LRU = LRU(8192, 600.0)
+
 
 class Colors(StrEnum):
     """
@@ -45,6 +54,60 @@ class Colors(StrEnum):
     N31L_GREEN = "#00FF00"
 
 
+def forget(kind: str, id: int) -> None:
+    """Invalidate the cached entity and expansions for the provided entity."""
+
+    entities.pop((kind, id))
+
+    for format, show_id in product((True, False), repeat=2):
+        expansions.pop((kind, id, format, show_id))
+
+
+async def resolve_user(id: Snowflake, client: GatewayClient) -> User:
+    """Return the user for the provided ID, preferring cached copies."""
+
+    if user := client.cache.get_user(id):
+        return user
+    elif user := entities.get(("user", id)):
+        return user
+
+    user = await client.rest.fetch_user(id)
+
+    entities.set(("user", id), user)
+
+    return user
+
+
+async def resolve_server(id: Snowflake, client: GatewayClient) -> Guild:
+    """Return the server for the provided ID, preferring cached copies."""
+
+    if server := client.cache.get_guild(id):
+        return server
+    elif server := entities.get(("server", id)):
+        return server
+
+    server = await client.rest.fetch_guild(id)
+
+    entities.set(("server", id), server)
+
+    return server
+
+
+async def resolve_channel(id: Snowflake, client: GatewayClient) -> PartialChannel:
+    """Return the channel for the provided ID, preferring cached copies."""
+
+    if channel := client.cache.get_guild_channel(id) or client.cache.get_thread(id):
+        return channel
+    elif channel := entities.get(("channel", id)):
+        return channel
+
+    channel = await client.rest.fetch_channel(id)
+
+    entities.set(("channel", id), channel)
+
+    return channel
+
+
 def expand_command(
     ctx: GatewayContext,
     *,
@@ -64,7 +127,7 @@ def expand_command(
             return ctx.command.make_mention()
         else:
             logger.debug(
-                f"Attempted to mention command of invalid type {type(ctx.command)}"
+                "Attempted to mention command of invalid type {}", type(ctx.command)
             )
 
     result: str = ctx.command.name
@@ -85,7 +148,7 @@ def expand_command(
     if format:
         result = f"`{result}`"
 
-    logger.debug(f"Expanded command {ctx.command.name} to {result}")
+    logger.debug("Expanded command {} to {}", ctx.command.name, result)
 
     return result
 
@@ -101,8 +164,10 @@ async def expand_user(
     """Build a modular string for the provided user."""
 
     if isinstance(user, Snowflake):
-        if client:
-            user = await client.rest.fetch_user(user)
+        if mention:
+            return f"<@{user}>"
+        elif client:
+            user = await resolve_user(user, client)
         else:
             user = None
 
@@ -114,6 +179,11 @@ async def expand_user(
     if mention:
         return user.mention
 
+    key: Hashable = ("user", user.id, format, show_id)
+
+    if cached := expansions.get(key):
+        return cached
+
     result: str = ""
 
     if format:
@@ -127,7 +197,9 @@ async def expand_user(
         else:
             result += f" ({user.id})"
 
-    logger.debug(f"Expanded user {user} to {result}")
+    logger.debug("Expanded user {} to {}", user, result)
+
+    expansions.set(key, result)
 
     return result
 
@@ -143,7 +215,7 @@ async def expand_server(
 
     if isinstance(server, Snowflake):
         if client:
-            server = await client.rest.fetch_guild(server)
+            server = await resolve_server(server, client)
         else:
             server = None
 
@@ -152,6 +224,11 @@ async def expand_server(
 
         return "Unknown Server"
 
+    key: Hashable = ("server", server.id, format, show_id)
+
+    if cached := expansions.get(key):
+        return cached
+
     result: str = ""
 
     if format:
@@ -165,7 +242,9 @@ async def expand_server(
         else:
             result += f" ({server.id})"
 
-    logger.debug(f"Expanded server {server} to {result}")
+    logger.debug("Expanded server {} to {}", server, result)
+
+    expansions.set(key, result)
 
     return result
 
@@ -186,8 +265,10 @@ async def expand_channel(
     """Build a modular string for the provided channel."""
 
     if isinstance(channel, Snowflake):
-        if client:
-            channel = await client.rest.fetch_channel(channel)
+        if mention:
+            return f"<#{channel}>"
+        elif client:
+            channel = await resolve_channel(channel, client)
         else:
             channel = None
 
@@ -202,6 +283,11 @@ async def expand_channel(
     if mention:
         return channel.mention
 
+    key: Hashable = ("channel", channel.id, format, show_id)
+
+    if cached := expansions.get(key):
+        return cached
+
     result: str = ""
 
     if channel.name:
@@ -216,7 +302,9 @@ async def expand_channel(
         else:
             result += f" ({channel.id})"
 
-    logger.debug(f"Expanded channel {channel} to {result}")
+    logger.debug("Expanded channel {} to {}", channel, result)
+
+    expansions.set(key, result)
 
     return result
 
@@ -252,7 +340,7 @@ def expand_thread(
         else:
             result += f" ({thread.id})"
 
-    logger.debug(f"Expanded thread {thread} to {result}")
+    logger.debug("Expanded thread {} to {}", thread, result)
 
     return result
 
@@ -287,7 +375,7 @@ def expand_role(
         else:
             result += f" ({role.id})"
 
-    logger.debug(f"Expanded role {role} to {result}")
+    logger.debug("Expanded role {} to {}", role, result)
 
     return result
 
@@ -315,7 +403,7 @@ def expand_interaction(
     else:
         result += f" {interaction.type} ({type(interaction)})"
 
-    logger.debug(f"Expanded interaction {interaction} to {result}")
+    logger.debug("Expanded interaction {} to {}", interaction, result)
 
     # lstrip() to remove leading whitespace if show_id is False
     return result.lstrip()
@@ -505,7 +593,7 @@ def format_options(options: list[CommandInteractionOption]) -> str:
                 f"Failed to parse commnad option {option.name} of type {type(option.value)}"
             )
 
-    logger.debug(f"Formatted options {options} to sequence {result}")
+    logger.debug("Formatted options {} to sequence {}", options, result)
 
     return result.rstrip()
 
@@ -561,12 +649,12 @@ async def json_to_embed(data: str | dict[str, Any] | Attachment | None) -> list[
     if isinstance(data, Attachment):
         data = (await data.read()).decode("UTF-8")
 
-        logger.trace(f"{data=}")
+        logger.trace("data={!r}", data)
 
     if isinstance(data, str):
         data = json.loads(data)
 
-        logger.trace(f"{data=}")
+        logger.trace("data={!r}", data)
 
     if isinstance(data, dict):
         if value := data.get("embeds"):
@@ -574,10 +662,10 @@ async def json_to_embed(data: str | dict[str, Any] | Attachment | None) -> list[
         else:
             entries = [data]
 
-    logger.trace(f"{entries=}")
+    logger.trace("entries={!r}", entries)
 
     for entry in entries:
-        logger.trace(f"{entry=}")
+        logger.trace("entry={!r}", entry)
 
         embed: Embed = Embed(
             title=entry.get("title"),
@@ -590,7 +678,7 @@ async def json_to_embed(data: str | dict[str, Any] | Attachment | None) -> list[
         )
 
         if author := entry.get("author"):
-            logger.trace(f"{author=}")
+            logger.trace("author={!r}", author)
 
             embed.set_author(
                 name=author.get("name"),
@@ -599,25 +687,25 @@ async def json_to_embed(data: str | dict[str, Any] | Attachment | None) -> list[
             )
 
         if thumb := entry.get("thumbnail"):
-            logger.trace(f"{thumb=}")
+            logger.trace("thumb={!r}", thumb)
 
             embed.set_thumbnail(thumb.get("url"))
 
         if image := entry.get("image"):
-            logger.trace(f"{image=}")
+            logger.trace("image={!r}", image)
 
             embed.set_image(image.get("url"))
 
         if footer := entry.get("footer"):
-            logger.trace(f"{footer=}")
+            logger.trace("footer={!r}", footer)
 
             embed.set_footer(footer.get("text"), icon=footer.get("icon_url"))
 
         if fields := entry.get("fields", []):
-            logger.trace(f"{fields=}")
+            logger.trace("fields={!r}", fields)
 
             for field in fields:
-                logger.trace(f"{field=}")
+                logger.trace("field={!r}", field)
 
                 embed.add_field(
                     field.get("name"),
@@ -625,10 +713,10 @@ async def json_to_embed(data: str | dict[str, Any] | Attachment | None) -> list[
                     inline=field.get("inline"),
                 )
 
-        logger.trace(f"{embed=}")
+        logger.trace("embed={!r}", embed)
 
         results.append(embed)
 
-    logger.debug(f"Formed {len(results):,} embed objects from the provided JSON data")
+    logger.debug("Formed {:,} embed objects from the provided JSON data", len(results))
 
     return results
@@ -0,0 +1,89 @@
+import time
+from typing import Self
+
+from loguru import logger
+
+
+class Health:
+    """
+    Exponentially decayed latency, error rate, and invalid payload rate
+    for a single source.
+
+    Sources are benched after repeated consecutive failures and probed
+    again once their bench period expires.
+    """
+
+    # Weight given to the newest sample
+    decay: float = 0.2
+
+    # Consecutive failures before a source is benched
+    threshold: int = 3
+
+    # Bench period in seconds, doubled for each failed probe
+    bench_min: float = 60.0
+    bench_max: float = 900.0
+
+    # Minimum score so unhealthy sources are still occasionally chosen
+    floor: float = 0.05
+
+    def __init__(self: Self, name: str) -> None:
+        """Initialize a source with a perfect score."""
+
+        self.name: str = name
+        self.latency: float | None = None
+        self.errors: float = 0.0
+        self.invalid: float = 0.0
+        self.failures: int = 0
+        self.bench: float = 0.0
+        self.benched_until: float = 0.0
+
+    def record(self: Self, latency: float, *, error: bool, invalid: bool) -> None:
+        """Record the outcome of a single request to the source."""
+
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.decay * (latency - self.latency)
+
+        self.errors += self.decay * (float(error) - self.errors)
+        self.invalid += self.decay * (float(invalid) - self.invalid)
+
+        if (not error) and (not invalid):
+            if self.benched_until:
+                logger.info(f"Restored source {self.name}, probe succeeded")
+
+            self.failures = 0
+            self.bench = 0.0
+            self.benched_until = 0.0
+
+            return
+
+        self.failures += 1
+
+        if self.failures < self.threshold:
+            return
+
+        self.bench = min(self.bench * 2, self.bench_max) or self.bench_min
+        self.benched_until = time.monotonic() + self.bench
+
+        logger.warning(
+            f"Benched source {self.name} for {self.bench:,.0f}s after {self.failures:,} consecutive failures"
+        )
+
+    def available(self: Self) -> bool:
+        """Determine whether the source is not benched or is due a probe."""
+
+        return self.benched_until <= time.monotonic()
+
+    def score(self: Self) -> float:
+        """
+        Return a weight for the source, favoring low latency and low
+        error and invalid payload rates.
+        """
+
+        score: float = (1.0 - self.errors) * (1.0 - self.invalid)
+
+        if self.latency:
+            score /= 1.0 + self.latency
+
+        return max(score, self.floor)
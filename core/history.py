@@ -0,0 +1,174 @@
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Self, Sequence
+
+from hikari import (
+    UNDEFINED,
+    Attachment,
+    Embed,
+    Message,
+    PartialMessage,
+    PartialSticker,
+    Snowflake,
+    User,
+)
+
+
+class Entry:
+    """
+    Compact record of a message, exposing the same attributes as a hikari
+    Message for those used to render message logs.
+    """
+
+    __slots__ = (
+        "id",
+        "channel_id",
+        "guild_id",
+        "author",
+        "content",
+        "attachments",
+        "stickers",
+        "embeds",
+        "timestamp",
+        "edited_timestamp",
+    )
+
+    def __init__(self: Self, message: Message) -> None:
+        """Record the relevant attributes of the provided message."""
+
+        self.id: Snowflake = message.id
+        self.channel_id: Snowflake = message.channel_id
+        self.guild_id: Snowflake | None = message.guild_id
+        self.author: User = message.author
+        self.content: str | None = message.content
+        self.attachments: Sequence[Attachment] = message.attachments
+        self.stickers: Sequence[PartialSticker] = message.stickers
+        self.embeds: Sequence[Embed] = message.embeds
+        self.timestamp: datetime = message.timestamp
+        self.edited_timestamp: datetime | None = message.edited_timestamp
+
+    @property
+    def created_at(self: Self) -> datetime:
+        """When the message was created."""
+
+        return self.timestamp
+
+    def update(self: Self, message: PartialMessage) -> None:
+        """Apply the provided partial message edit to the record."""
+
+        if message.content is not UNDEFINED:
+            self.content = message.content
+
+        if message.attachments is not UNDEFINED:
+            self.attachments = message.attachments
+
+        if message.stickers is not UNDEFINED:
+            self.stickers = message.stickers
+
+        if message.embeds is not UNDEFINED:
+            self.embeds = message.embeds
+
+        if message.edited_timestamp is not UNDEFINED:
+            self.edited_timestamp = message.edited_timestamp
+
+
+class History:
+    """
+    Bounded ring buffers of the most recent messages in each channel,
+    kept up to date with edits and deletions as they are received.
+    """
+
+    def __init__(self: Self, size: int, channels: int = 256) -> None:
+        """
+        Initialize empty buffers of size messages for at most the
+        specified number of channels.
+        """
+
+        self.size: int = size
+        self.limit: int = channels
+        self.channels: OrderedDict[int, deque[Entry]] = OrderedDict()
+
+    def add(self: Self, message: Message) -> None:
+        """Record a newly created message."""
+
+        if not (buffer := self.channels.get(message.channel_id)):
+            buffer = self.channels[message.channel_id] = deque(maxlen=self.size)
+
+            while len(self.channels) > self.limit:
+                self.channels.popitem(last=False)
+
+        self.channels.move_to_end(message.channel_id)
+
+        buffer.append(Entry(message))
+
+    def find(self: Self, channel_id: int, message_id: int) -> int | None:
+        """Return the index of a message in its channel buffer, if recorded."""
+
+        if not (buffer := self.channels.get(channel_id)):
+            return
+
+        # Messages are appended in order, search from the newest
+        for index in range(len(buffer) - 1, -1, -1):
+            if buffer[index].id == message_id:
+                return index
+            elif buffer[index].id < message_id:
+                return
+
+    def edit(self: Self, message: PartialMessage) -> None:
+        """Apply an edit to a recorded message."""
+
+        if (index := self.find(message.channel_id, message.id)) is not None:
+            self.channels[message.channel_id][index].update(message)
+
+    def delete(self: Self, channel_id: int, message_ids: Sequence[int]) -> None:
+        """Remove deleted messages from the channel buffer."""
+
+        if not (buffer := self.channels.get(channel_id)):
+            return
+
+        for message_id in message_ids:
+            if (index := self.find(channel_id, message_id)) is not None:
+                del buffer[index]
+
+    def before(
+        self: Self, channel_id: int, message_id: int, limit: int
+    ) -> list[Entry] | None:
+        """
+        Return up to limit recorded messages preceding the specified
+        message in chronological order, or None if it is not recorded.
+        """
+
+        if (index := self.find(channel_id, message_id)) is None:
+            return
+
+        buffer: deque[Entry] = self.channels[channel_id]
+
+        return [buffer[i] for i in range(max(index - limit, 0), index)]
+
+    def after(
+        self: Self, channel_id: int, message_id: int, limit: int
+    ) -> list[Entry] | None:
+        """
+        Return up to limit recorded messages following the specified
+        message in chronological order, or None if it is not recorded.
+
+        Every message since a recorded message has been seen, so the result
+        is complete as long as the buffers are cleared upon reconnecting.
+        """
+
+        if (index := self.find(channel_id, message_id)) is None:
+            return
+
+        buffer: deque[Entry] = self.channels[channel_id]
+
+        return [
+            buffer[i] for i in range(index + 1, min(index + 1 + limit, len(buffer)))
+        ]
+
+    def clear(self: Self) -> None:
+        """
+        Discard every buffer, as messages sent while disconnected were not
+        recorded.
+        """
+
+        self.channels.clear()
@@ -6,7 +6,10 @@ from arc import (
 )
 from loguru import logger
 
+from core.animals import animalPrefetch
+from core.audit import Audit
 from core.config import Config
+from core.food import foodPrefetch
 from core.formatters import (
     Colors,
     expand_channel,
@@ -17,19 +20,45 @@ from core.formatters import (
     random_string,
     response,
 )
-from extensions.threads import task_archive_threads
+from core.reddit import reddit_start, reddit_stop, task_poll_reddit
+from core.utils import http_create, http_destroy
+from extensions.threads import scheduler_start, scheduler_stop
 
 
 async def hook_start(client: GatewayClient) -> None:
     """Handle client startup."""
 
-    task_archive_threads.start(client)
+    cfg: Config = client.get_type_dependency(Config)
+
+    await http_create()
+
+    client.get_type_dependency(Audit).start(client.app)
+
+    await reddit_start()
+
+    task_poll_reddit.set_interval(seconds=cfg.reddit_interval)
+    task_poll_reddit.start(client)
+
+    animalPrefetch.start(cfg.prefetch_size, cfg.prefetch_watermark)
+    foodPrefetch.start(cfg.prefetch_size, cfg.prefetch_watermark)
+
+    scheduler_start(client)
 
 
 async def hook_stop(client: GatewayClient) -> None:
     """Handle client shutdown."""
 
-    task_archive_threads.cancel()
+    # Stop every producer of audit log messages before the audit log itself
+    await scheduler_stop(client)
+    task_poll_reddit.cancel()
+
+    await animalPrefetch.stop()
+    await foodPrefetch.stop()
+    await client.get_type_dependency(Audit).stop()
+
+    await reddit_stop()
+
+    await http_destroy()
 
 
 async def hook_log(ctx: GatewayContext) -> None:
@@ -47,7 +76,7 @@ async def hook_log(ctx: GatewayContext) -> None:
     user = await expand_user(ctx.user)
     channel = await expand_channel(ctx.channel)
 
-    await ctx.client.rest.create_message(
+    ctx.client.get_type_dependency(Audit).write(
         cfg.channels["user"],
         log("robot", f"{user} used command `{command}` in {channel}"),
     )
@@ -0,0 +1,78 @@
+import re
+from re import Match, Pattern
+from typing import Self
+
+from loguru import logger
+
+
+class Keywords:
+    """
+    Compiled matcher for a list of keywords.
+
+    Keywords are matched case-insensitively as whole words. A keyword may
+    be a phrase of multiple words, and may contain * wildcards which match
+    any run of non-whitespace characters.
+    """
+
+    def __init__(self: Self, keywords: list[str]) -> None:
+        """Compile the provided keywords into a single pattern."""
+
+        self.keywords: list[str] = [k.strip() for k in keywords if k.strip()]
+        self.pattern: Pattern[str] | None = None
+
+        if not self.keywords:
+            return
+
+        alternatives: list[str] = []
+
+        # Prefer longer keywords where multiple keywords overlap
+        for index, keyword in sorted(
+            enumerate(self.keywords), key=lambda entry: -len(entry[1])
+        ):
+            words: list[str] = [
+                r"\S*".join(re.escape(part) for part in word.split("*"))
+                for word in keyword.split()
+            ]
+
+            alternatives.append(f"(?P<k{index}>{r'\s+'.join(words)})")
+
+        self.pattern = re.compile(
+            rf"(?<!\S)(?:{'|'.join(alternatives)})(?!\S)", re.IGNORECASE
+        )
+
+        logger.debug(f"Compiled {len(self.keywords):,} keywords")
+
+    def find(self: Self, content: str) -> list[Match[str]]:
+        """Return all keyword matches in the provided content."""
+
+        if not self.pattern:
+            return []
+
+        return list(self.pattern.finditer(content))
+
+    def names(self: Self, matches: list[Match[str]]) -> list[str]:
+        """Return the unique keywords of the provided matches, in order."""
+
+        return list(
+            dict.fromkeys(
+                self.keywords[int(match.lastgroup[1:])]
+                for match in matches
+                if match.lastgroup
+            )
+        )
+
+    def highlight(self: Self, content: str, matches: list[Match[str]]) -> str:
+        """Embolden the provided matches in the provided content."""
+
+        result: list[str] = []
+        position: int = 0
+
+        for match in matches:
+            result.append(content[position : match.start()])
+            result.append(f"**{match.group()}**")
+
+            position = match.end()
+
+        result.append(content[position:])
+
+        return "".join(result)
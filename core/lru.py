@@ -0,0 +1,55 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Self
+
+
+class LRU:
+    """Least recently used mapping, bounded by entry count and entry age."""
+
+    def __init__(self: Self, size: int, ttl: float) -> None:
+        """Initialize an empty mapping of at most size entries of ttl seconds."""
+
+        self.size: int = size
+        self.ttl: float = ttl
+        self.entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __contains__(self: Self, key: Hashable) -> bool:
+        """Determine whether an unexpired value exists for the provided key."""
+
+        return self.get(key) is not None
+
+    def get(self: Self, key: Hashable) -> Any | None:
+        """Return the unexpired value for the provided key, if any."""
+
+        if not (entry := self.entries.get(key)):
+            return
+
+        if entry[0] <= time.monotonic():
+            del self.entries[key]
+
+            return
+
+        self.entries.move_to_end(key)
+
+        return entry[1]
+
+    def set(self: Self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries as needed."""
+
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def pop(self: Self, key: Hashable) -> Any | None:
+        """Remove and return the value for the provided key, if any."""
+
+        if entry := self.entries.pop(key, None):
+            return entry[1]
+
+    def clear(self: Self) -> None:
+        """Remove all entries."""
+
+        self.entries.clear()
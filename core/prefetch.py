@@ -0,0 +1,263 @@
+import asyncio
+import random
+import time
+from asyncio import Event, Task
+from collections import deque
+from typing import Awaitable, Callable, Self
+
+from hikari import Embed
+from loguru import logger
+
+from core.health import Health
+from core.utils import http_status
+
+Provider = Callable[[], Awaitable[Embed | None]]
+
+
+class Prefetch:
+    """
+    Bounded buffers of ready-to-send Embed objects for each type of a
+    command, refilled in the background by the provided sources.
+    """
+
+    def __init__(
+        self: Self, name: str, sources: dict[str, dict[str, Provider]]
+    ) -> None:
+        """Initialize empty buffers for every type of the provided sources."""
+
+        self.name: str = name
+        self.sources: dict[str, dict[str, Provider]] = sources
+        self.size: int = 0
+        self.watermark: int = 0
+        self.buffers: dict[str, deque[Embed]] = {type: deque() for type in sources}
+        self.health: dict[str, dict[str, Health]] = {
+            type: {name: Health(f"{type} {name}") for name in providers}
+            for type, providers in sources.items()
+        }
+        self.hits: int = 0
+        self.misses: int = 0
+
+        # Failed fetches tolerated per refill of a buffer
+        self.attempts: int = 4
+
+        self.wake: Event = Event()
+        self.task: Task[None] | None = None
+
+    def start(self: Self, size: int, watermark: int) -> None:
+        """
+        Begin refilling buffers up to the specified size whenever a buffer
+        drops to or below the specified watermark.
+        """
+
+        if self.task or size < 1:
+            return
+
+        self.size = size
+        self.watermark = min(watermark, size - 1)
+        self.buffers = {type: deque(maxlen=size) for type in self.sources}
+        self.task = asyncio.create_task(self.refill())
+
+        self.wake.set()
+
+        logger.debug(
+            f"Started {self.name} prefetch (size: {size:,}, watermark: {self.watermark:,})"
+        )
+
+    async def stop(self: Self) -> None:
+        """Cancel the background refill and discard buffered Embeds."""
+
+        if not self.task:
+            return
+
+        self.task.cancel()
+
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+        self.task = None
+
+        for buffer in self.buffers.values():
+            buffer.clear()
+
+        logger.info(
+            f"Stopped {self.name} prefetch ({self.hits:,} hits, {self.misses:,} misses)"
+        )
+
+    def pop(self: Self, type: str) -> Embed | None:
+        """Return a buffered Embed for the specified type, if available."""
+
+        buffer: deque[Embed] | None = self.buffers.get(type)
+
+        if not buffer:
+            self.misses += 1
+
+            logger.debug(f"Missed {self.name} prefetch for type {type}")
+
+            self.wake.set()
+
+            return
+
+        self.hits += 1
+
+        if len(buffer) <= self.watermark + 1:
+            self.wake.set()
+
+        return buffer.popleft()
+
+    def rank(self: Self, type: str) -> list[str]:
+        """
+        Return the available sources for the specified type, ordered by a
+        random choice weighted by health score.
+        """
+
+        health: dict[str, Health] = self.health.get(type, {})
+        names: list[str] = [name for name, h in health.items() if h.available()]
+
+        # Probe every source when all of them are benched
+        if not names:
+            names = list(health)
+
+        ranked: list[str] = []
+
+        while names:
+            name: str = random.choices(
+                names, weights=[health[name].score() for name in names]
+            )[0]
+
+            names.remove(name)
+            ranked.append(name)
+
+        return ranked
+
+    async def call(self: Self, type: str, name: str) -> Embed | None:
+        """Fetch an Embed from the specified source and record its health."""
+
+        health: Health = self.health[type][name]
+        start: float = time.perf_counter()
+        result: Embed | None = None
+        error: bool = False
+
+        http_status.set(None)
+
+        try:
+            result = await self.sources[type][name]()
+        except asyncio.CancelledError:
+            # Cancelled requests lost a race, their outcome is unknown
+            raise
+        except Exception as e:
+            logger.opt(exception=e).error(f"Failed to fetch {self.name} from {name}")
+
+            error = True
+
+        if not result:
+            status: int | None = http_status.get()
+            error = error or ((status is not None) and (not 200 <= status < 300))
+
+        health.record(
+            time.perf_counter() - start,
+            error=error,
+            invalid=(not error) and (not result),
+        )
+
+        return result
+
+    async def fetch(self: Self, type: str) -> Embed | None:
+        """Fetch an Embed for the specified type from its healthiest source."""
+
+        if not (names := self.rank(type)):
+            logger.warning(f"Recieved unknown {self.name} type {type}")
+
+            return
+
+        return await self.call(type, names[0])
+
+    async def race(self: Self, type: str, hedge: float = 0.0) -> Embed | None:
+        """
+        Fetch an Embed for the specified type from all of its sources,
+        staggered by the hedge delay, and return the first valid result.
+
+        Sources are started in order of health and benched sources are
+        skipped. Remaining requests are cancelled once a result is found.
+        Types with a single source are hedged against a second request to
+        that source.
+        """
+
+        if not (queue := self.rank(type)):
+            logger.warning(f"Recieved unknown {self.name} type {type}")
+
+            return
+
+        tasks: set[Task[Embed | None]] = set()
+
+        if len(queue) == 1:
+            queue.append(queue[0])
+
+        try:
+            while queue or tasks:
+                if queue:
+                    tasks.add(asyncio.create_task(self.call(type, queue.pop(0))))
+
+                done, tasks = await asyncio.wait(
+                    tasks,
+                    timeout=hedge if queue else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    if task.cancelled() or task.exception():
+                        continue
+                    elif result := task.result():
+                        return result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        logger.debug(f"Failed to race {self.name} sources for type {type}")
+
+    async def fill(self: Self, type: str) -> None:
+        """
+        Fetch Embeds for the specified type until its buffer is full.
+
+        Failed fetches move on to the next ranked source, up to the limit
+        of failed attempts per refill.
+        """
+
+        buffer: deque[Embed] = self.buffers[type]
+        failures: int = 0
+
+        while (len(buffer) < self.size) and (failures < self.attempts):
+            if not (names := self.rank(type)):
+                return
+
+            for name in names:
+                if embed := await self.call(type, name):
+                    buffer.append(embed)
+
+                    break
+
+                if (failures := failures + 1) >= self.attempts:
+                    break
+
+        if len(buffer) < self.size:
+            logger.debug(
+                f"Paused {self.name} prefetch for type {type}, {failures:,} fetches failed"
+            )
+
+    async def refill(self: Self) -> None:
+        """Refill all buffers at or below the watermark when woken."""
+
+        while True:
+            await self.wake.wait()
+
+            self.wake.clear()
+
+            await asyncio.gather(
+                *(
+                    self.fill(type)
+                    for type, buffer in self.buffers.items()
+                    if len(buffer) <= self.watermark
+                ),
+                return_exceptions=True,
+            )
@@ -1,8 +1,83 @@
+import asyncio
+import time
+from asyncio import Semaphore
+from typing import Self
+
+import arc
 import asyncpraw
+from arc import GatewayClient
+from asyncpraw.models import Subreddit
 from asyncpraw.reddit import Reddit
 from environs import env
 from loguru import logger
 
+from core.audit import Audit
+from core.config import Config
+from core.formatters import log
+
+# Shared Reddit client, created and destroyed by the client hooks
+reddit: Reddit | None = None
+
+# Fetched Reddit communities, keyed by name
+subreddits: dict[str, Subreddit] = {}
+
+# Concurrent Reddit queue scans
+reddit_limit: Semaphore = Semaphore(6)
+
+# Moderated Reddit communities, keyed by display name
+communities: dict[str, str] = {
+    "r/CODBlackOps7": "CODBlackOps7",
+    "r/BlackOps6": "BlackOps6",
+    "r/ModernWarfareIII": "ModernWarfareIII",
+    "r/ModernWarfareII": "ModernWarfareII",
+    "r/CODVanguard": "CODVanguard",
+    "r/BlackOpsColdWar": "BlackOpsColdWar",
+    "r/CODWarzone": "CODWarzone",
+    "r/ModernWarfare": "ModernWarfare",
+    "r/BlackOps4": "BlackOps4",
+    "r/WWII": "WWII",
+    "r/InfiniteWarfare": "InfiniteWarfare",
+    "r/CODZombies": "CODZombies",
+    "r/CallofDuty": "CallofDuty",
+}
+
+
+class Snapshot:
+    """Queue counts of a Reddit community at a point in time."""
+
+    __slots__ = ("community", "mod", "unmod", "taken", "previous")
+
+    def __init__(
+        self: Self,
+        community: str,
+        mod: int,
+        unmod: int,
+        previous: "Snapshot | None" = None,
+    ) -> None:
+        """Record the provided queue counts, following the previous snapshot."""
+
+        self.community: str = community
+        self.mod: int = mod
+        self.unmod: int = unmod
+        self.taken: float = time.time()
+        self.previous: Snapshot | None = previous
+
+        # Only the latest delta is kept
+        if previous:
+            previous.previous = None
+
+    def delta(self: Self) -> tuple[int, int] | None:
+        """Return the change in queue counts since the previous snapshot."""
+
+        if not self.previous:
+            return
+
+        return self.mod - self.previous.mod, self.unmod - self.previous.unmod
+
+
+# Latest queue counts, keyed by community
+snapshots: dict[str, Snapshot] = {}
+
 
 async def client_create() -> Reddit | None:
     """Create an authenticated Reddit client using the configured credentials."""
@@ -49,32 +124,163 @@ async def client_destroy(client: Reddit) -> None:
         logger.opt(exception=e).warning("Failed to close Reddit session")
 
 
-async def count_modqueue(client: Reddit, community: str) -> int:
+async def reddit_start() -> Reddit | None:
+    """Create the shared Reddit client, if not already created."""
+
+    global reddit
+
+    if not reddit:
+        reddit = await client_create()
+
+    return reddit
+
+
+def reddit_client() -> Reddit | None:
+    """Return the shared Reddit client, if created."""
+
+    return reddit
+
+
+async def reddit_stop() -> None:
+    """Close the shared Reddit client and discard fetched communities."""
+
+    global reddit
+
+    subreddits.clear()
+
+    if not reddit:
+        return
+
+    await client_destroy(reddit)
+
+    reddit = None
+
+
+@arc.utils.interval_loop(seconds=300)
+async def task_poll_reddit(client: GatewayClient) -> None:
+    """Refresh the queue counts of every moderated Reddit community."""
+
+    if not (reddit := reddit_client()):
+        logger.debug("Skipped Reddit queue poll, Reddit client is null")
+
+        return
+
+    logger.info("Beginning recurring task to poll Reddit queues...")
+
+    cfg: Config = client.get_type_dependency(Config)
+    requested: list[str] = list(communities.values())
+    counts: list[tuple[int, int] | None] = await asyncio.gather(
+        *(count_queues(reddit, request) for request in requested)
+    )
+
+    for request, count in zip(requested, counts):
+        # Keep the previous snapshot rather than record a failed count as empty
+        if not count:
+            logger.warning(f"Skipped Reddit community r/{request}, failed to count")
+
+            continue
+
+        mod, unmod = count
+        snapshot: Snapshot = Snapshot(request, mod, unmod, snapshots.get(request))
+        snapshots[request] = snapshot
+
+        if not (delta := snapshot.delta()):
+            continue
+
+        for queue, path, count, change in [
+            ("moderation", "modqueue", mod, delta[0]),
+            ("unmoderated", "unmoderated", unmod, delta[1]),
+        ]:
+            if change < cfg.reddit_spike:
+                continue
+
+            client.get_type_dependency(Audit).write(
+                cfg.channels["reddit"],
+                log(
+                    "rotating_light",
+                    f"r/{request} [{queue} queue](https://reddit.com/r/{request}/about/{path}) spiked by {change:,} to {count:,} items",
+                ),
+            )
+
+            logger.warning(
+                f"Reddit community r/{request} {queue} queue spiked by {change:,} to {count:,} items"
+            )
+
+    logger.info("Completed recurring task to poll Reddit queues")
+
+
+async def get_subreddit(client: Reddit, community: str) -> Subreddit | None:
+    """Return the specified Reddit community, fetching it upon first use."""
+
+    if subreddit := subreddits.get(community):
+        return subreddit
+
+    subreddit = await client.subreddit(community, fetch=True)  # type: ignore
+
+    if subreddit:
+        subreddits[community] = subreddit
+
+    return subreddit
+
+
+async def count_queues(client: Reddit, community: str) -> tuple[int, int] | None:
+    """
+    Return the number of items in the moderation and unmoderated queues
+    for the specified Reddit community, counted concurrently.
+
+    Return None if either queue could not be counted.
+    """
+
+    # Fetch the community once before both queues are counted
+    try:
+        await get_subreddit(client, community)
+    except Exception as e:
+        logger.opt(exception=e).error(f"Failed to fetch Reddit community r/{community}")
+
+        return
+
+    mod, unmod = await asyncio.gather(
+        count_modqueue(client, community), count_unmoderated(client, community)
+    )
+
+    if (mod is None) or (unmod is None):
+        return
+
+    return mod, unmod
+
+
+async def count_modqueue(client: Reddit, community: str) -> int | None:
     """
     Return the number of items in the moderation queue for the
-    specified Reddit community.
+    specified Reddit community, or None upon failure.
     """
 
     total: int = 0
 
-    subreddit = await client.subreddit(community, fetch=True)  # type: ignore
+    try:
+        subreddit: Subreddit | None = await get_subreddit(client, community)
+    except Exception as e:
+        logger.opt(exception=e).error(f"Failed to fetch Reddit community r/{community}")
+
+        return
 
     if not subreddit:
         logger.error(
             f"Failed to fetch modqueue count for Reddit community r/{community}, subreddit is null"
         )
 
-        return total
+        return
 
     try:
-        async for _ in subreddit.mod.modqueue(limit=None):  # type: ignore
-            total += 1
+        async with reddit_limit:
+            async for _ in subreddit.mod.modqueue(limit=None):  # type: ignore
+                total += 1
     except Exception as e:
         logger.opt(exception=e).error(
             f"Failed to count moderation queue in Reddit community r/{community}"
         )
 
-        return total
+        return
 
     logger.success(
         f"Fetched moderation queue count ({total:,}) for Reddit community r/{community}"
@@ -83,32 +289,38 @@ async def count_modqueue(client: Reddit, community: str) -> int:
     return total
 
 
-async def count_unmoderated(client: Reddit, community: str) -> int:
+async def count_unmoderated(client: Reddit, community: str) -> int | None:
     """
     Return the number of items in the unmoderated queue for the
-    specified Reddit community.
+    specified Reddit community, or None upon failure.
     """
 
     total: int = 0
 
-    subreddit = await client.subreddit(community, fetch=True)  # type: ignore
+    try:
+        subreddit: Subreddit | None = await get_subreddit(client, community)
+    except Exception as e:
+        logger.opt(exception=e).error(f"Failed to fetch Reddit community r/{community}")
+
+        return
 
     if not subreddit:
         logger.error(
             f"Failed to fetch unmoderated count for Reddit community r/{community}, subreddit is null"
         )
 
-        return total
+        return
 
     try:
-        async for _ in subreddit.mod.unmoderated(limit=None):  # type: ignore
-            total += 1
+        async with reddit_limit:
+            async for _ in subreddit.mod.unmoderated(limit=None):  # type: ignore
+                total += 1
     except Exception as e:
         logger.opt(exception=e).error(
             f"Failed to count unmoderated queue in Reddit community r/{community}"
         )
 
-        return total
+        return
 
     logger.success(
         f"Fetched unmoderated queue count ({total:,}) for Reddit community r/{community}"
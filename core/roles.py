@@ -0,0 +1,66 @@
+from typing import Self, Sequence
+
+from core.config import Config
+from core.lru import LRU
+
+
+class RolePolicy:
+    """
+    Precomputed policy for the roles members are allowed to equip.
+
+    A member may equip at most one allowed role, and only while also
+    equipping at least one required role.
+    """
+
+    def __init__(self: Self, require: Sequence[int], allow: Sequence[int]) -> None:
+        """Compile the provided required and allowed roles."""
+
+        self.require: frozenset[int] = frozenset(require)
+        self.allow: frozenset[int] = frozenset(allow)
+
+        # Last validated role set of each member, keyed by (server, member)
+        self.validated: LRU = LRU(8192, 3600.0)
+
+    @classmethod
+    def from_config(cls: type[Self], cfg: Config) -> Self:
+        """Compile the policy from the provided configuration."""
+
+        return cls(cfg.roles_require, cfg.roles_allow)
+
+    def diff(self: Self, equipped: Sequence[int]) -> tuple[list[int], str | None]:
+        """
+        Return the equipped roles which must be removed, in equipped order,
+        and the reason for their removal.
+        """
+
+        allowed: list[int] = []
+        required: bool = False
+
+        for role in equipped:
+            if role in self.allow:
+                allowed.append(role)
+            elif role in self.require:
+                required = True
+
+        if not allowed:
+            return [], None
+        elif not required:
+            return allowed, "Requirements not met."
+        elif len(allowed) > 1:
+            return allowed[1:], "Member exceeds limit (1) of allowed roles."
+
+        return [], None
+
+    def changed(
+        self: Self, server_id: int, member_id: int, equipped: frozenset[int]
+    ) -> bool:
+        """Determine whether the member's roles changed since last validated."""
+
+        return self.validated.get((server_id, member_id)) != equipped
+
+    def remember(
+        self: Self, server_id: int, member_id: int, equipped: frozenset[int]
+    ) -> None:
+        """Record the member's roles as validated."""
+
+        self.validated.set((server_id, member_id), equipped)
@@ -0,0 +1,200 @@
+import sqlite3
+from pathlib import Path
+from sqlite3 import Connection, Row
+from typing import Self
+
+from hikari import GuildThreadChannel
+from loguru import logger
+
+
+class ThreadRecord:
+    """
+    Compact record of a forum thread awaiting archival, exposing the same
+    attributes as a hikari GuildThreadChannel for those used to log it.
+    """
+
+    __slots__ = (
+        "id",
+        "guild_id",
+        "parent_id",
+        "owner_id",
+        "name",
+        "created_at",
+        "due",
+        "immune",
+        "checked",
+    )
+
+    def __init__(
+        self: Self,
+        id: int,
+        guild_id: int,
+        parent_id: int,
+        owner_id: int,
+        name: str,
+        created_at: float,
+        due: float,
+        immune: bool | None = None,
+        checked: float = 0.0,
+    ) -> None:
+        """Initialize a thread record."""
+
+        self.id: int = id
+        self.guild_id: int = guild_id
+        self.parent_id: int = parent_id
+        self.owner_id: int = owner_id
+        self.name: str = name
+        self.created_at: float = created_at
+        self.due: float = due
+        self.immune: bool | None = immune
+        self.checked: float = checked
+
+    @classmethod
+    def from_thread(cls: type[Self], thread: GuildThreadChannel, lifetime: int) -> Self:
+        """Record the provided thread, due once the lifetime expires."""
+
+        created_at: float = thread.created_at.timestamp()
+
+        return cls(
+            thread.id,
+            thread.guild_id,
+            thread.parent_id,
+            thread.owner_id,
+            thread.name or "",
+            created_at,
+            created_at + lifetime,
+        )
+
+    @property
+    def mention(self: Self) -> str:
+        """Mention string for the thread."""
+
+        return f"<#{self.id}>"
+
+
+class ThreadStore:
+    """
+    SQLite persistence for thread records, so archival resumes after a
+    restart without reclassifying thread authors.
+    """
+
+    schema: str = """
+        CREATE TABLE IF NOT EXISTS threads (
+            id INTEGER PRIMARY KEY,
+            guild_id INTEGER NOT NULL,
+            parent_id INTEGER NOT NULL,
+            owner_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            due REAL NOT NULL,
+            immune INTEGER,
+            checked REAL NOT NULL DEFAULT 0,
+            archived INTEGER NOT NULL DEFAULT 0
+        )
+    """
+
+    def __init__(self: Self, path: str) -> None:
+        """Initialize a store at the provided path, opened upon load."""
+
+        self.path: str = path
+        self.db: Connection | None = None
+
+    def open(self: Self) -> None:
+        """Open the database, creating it if necessary."""
+
+        if self.db:
+            return
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.db = sqlite3.connect(self.path, isolation_level=None)
+        self.db.row_factory = Row
+
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(ThreadStore.schema)
+
+        logger.debug(f"Opened thread store {self.path}")
+
+    def close(self: Self) -> None:
+        """Close the database."""
+
+        if not self.db:
+            return
+
+        self.db.close()
+
+        self.db = None
+
+    def load(self: Self) -> list[ThreadRecord]:
+        """
+        Return every thread not yet archived, discarding the records of
+        archived threads.
+        """
+
+        self.open()
+
+        if not self.db:
+            return []
+
+        self.db.execute("DELETE FROM threads WHERE archived = 1")
+
+        results: list[ThreadRecord] = [
+            ThreadRecord(
+                row["id"],
+                row["guild_id"],
+                row["parent_id"],
+                row["owner_id"],
+                row["name"],
+                row["created_at"],
+                row["due"],
+                None if row["immune"] is None else bool(row["immune"]),
+                row["checked"],
+            )
+            for row in self.db.execute("SELECT * FROM threads WHERE archived = 0")
+        ]
+
+        logger.debug(f"Loaded {len(results):,} threads from thread store")
+
+        return results
+
+    def save(self: Self, record: ThreadRecord) -> None:
+        """Insert or replace the provided thread record."""
+
+        if not self.db:
+            return
+
+        self.db.execute(
+            """
+            INSERT OR REPLACE INTO threads
+            (id, guild_id, parent_id, owner_id, name, created_at, due, immune, checked)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                record.id,
+                record.guild_id,
+                record.parent_id,
+                record.owner_id,
+                record.name,
+                record.created_at,
+                record.due,
+                record.immune,
+                record.checked,
+            ),
+        )
+
+    def archive(self: Self, threadId: int) -> None:
+        """Mark the provided thread as archived."""
+
+        if not self.db:
+            return
+
+        self.db.execute("UPDATE threads SET archived = 1 WHERE id = ?", (threadId,))
+
+    def delete(self: Self, threadId: int) -> None:
+        """Remove the provided thread."""
+
+        if not self.db:
+            return
+
+        self.db.execute("DELETE FROM threads WHERE id = ?", (threadId,))
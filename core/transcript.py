@@ -0,0 +1,153 @@
+import json
+from datetime import datetime
+from io import StringIO
+from typing import Any, Iterator, Self, Sequence
+
+from hikari import Embed, Message, User
+
+from core.history import Entry
+
+
+class Transcript:
+    """
+    Renderer for a chronological sequence of messages.
+
+    Output is written into a single in-memory buffer, so rendering is linear
+    in the number of messages regardless of format.
+    """
+
+    def __init__(self: Self, messages: Sequence[Message | Entry]) -> None:
+        """Prepare the provided messages for rendering."""
+
+        self.messages: Sequence[Message | Entry] = messages
+        self.authors: dict[int | None, str] = {}
+
+        # Resolve each unique author once
+        for message in messages:
+            if (key := Transcript.author_id(message.author)) not in self.authors:
+                self.authors[key] = Transcript.author(message.author)
+
+    def __len__(self: Self) -> int:
+        """Return the number of messages in the transcript."""
+
+        return len(self.messages)
+
+    @staticmethod
+    def author_id(user: User | None) -> int | None:
+        """Return the ID of a message author, if known."""
+
+        return user.id if user else None
+
+    @staticmethod
+    def author(user: User | None) -> str:
+        """Build the display string for a message author."""
+
+        if not user:
+            return "Unknown User"
+
+        return f"{user.username} ({user.id})"
+
+    @staticmethod
+    def embed(embed: Embed) -> dict[str, Any]:
+        """Reduce an embed to its populated, human-relevant fields."""
+
+        result: dict[str, Any] = {}
+
+        if embed.author and embed.author.name:
+            result["author"] = embed.author.name
+
+        if embed.title:
+            result["title"] = embed.title
+
+        if embed.url:
+            result["url"] = embed.url
+
+        if embed.description:
+            result["description"] = embed.description
+
+        if embed.fields:
+            result["fields"] = [
+                {"name": field.name, "value": field.value} for field in embed.fields
+            ]
+
+        if embed.image:
+            result["image"] = embed.image.url
+
+        if embed.thumbnail:
+            result["thumbnail"] = embed.thumbnail.url
+
+        if embed.footer and embed.footer.text:
+            result["footer"] = embed.footer.text
+
+        return result
+
+    def records(self: Self) -> Iterator[dict[str, Any]]:
+        """Yield a plain dictionary for each message in the transcript."""
+
+        for message in self.messages:
+            timestamp: datetime = message.timestamp
+            edited: datetime | None = message.edited_timestamp
+            author: int | None = Transcript.author_id(message.author)
+
+            yield {
+                "id": str(message.id),
+                "author": self.authors[author],
+                "author_id": str(author) if author else None,
+                "timestamp": timestamp.isoformat(),
+                "edited_timestamp": edited.isoformat() if edited else None,
+                "content": message.content or "",
+                "attachments": [str(a.url) for a in message.attachments],
+                "stickers": [str(s.make_url()) for s in message.stickers],
+                "embeds": [Transcript.embed(e) for e in message.embeds],
+            }
+
+    def render(self: Self, format: str = "txt") -> bytes:
+        """Render the transcript in the specified format, txt or jsonl."""
+
+        buffer: StringIO = StringIO()
+
+        match format:
+            case "txt":
+                self.write_txt(buffer)
+            case "jsonl":
+                self.write_jsonl(buffer)
+            case _:
+                raise ValueError(f"unsupported transcript format {format}")
+
+        return buffer.getvalue().encode("utf-8")
+
+    def write_txt(self: Self, buffer: StringIO) -> None:
+        """Write the transcript as plain text."""
+
+        for record in self.records():
+            buffer.write(f"{record['author']} at {record['timestamp']}")
+
+            if record["content"]:
+                buffer.write(f"\n{record['content']}")
+
+            for url in record["attachments"]:
+                buffer.write(f"\n{url}")
+
+            for url in record["stickers"]:
+                buffer.write(f"\n{url}")
+
+            for embed in record["embeds"]:
+                buffer.write("\n[Embed]")
+
+                for key, value in embed.items():
+                    if key != "fields":
+                        buffer.write(f"\n  {key.title()}: {value}")
+
+                        continue
+
+                    for field in value:
+                        buffer.write(f"\n  {field['name']}: {field['value']}")
+
+            buffer.write("\n\n")
+
+    def write_jsonl(self: Self, buffer: StringIO) -> None:
+        """Write the transcript as JSON Lines, one message per line."""
+
+        for record in self.records():
+            buffer.write(json.dumps(record, ensure_ascii=False))
+            buffer.write("\n")
@@ -1,14 +1,156 @@
+import asyncio
+import os
+import random
 import re
+import time
+from asyncio import Semaphore
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Any
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from importlib.util import find_spec
+from tempfile import mkstemp
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Self
+from urllib.parse import urlsplit
 
 import httpx
 from arc import GatewayClient
-from hikari import Guild, Member, NotFoundError
+from hikari import Member, NotFoundError, User
 from httpx import Response
 from loguru import logger
 
-from core.formatters import expand_server, expand_user
+from core.lru import LRU
+
+# Previously validated and invalidated user IDs
+users_valid: LRU = LRU(4096, 3600.0)
+users_invalid: LRU = LRU(4096, 600.0)
+
+# Maximum number of concurrent user ID validation requests
+users_limit: Semaphore = Semaphore(8)
+
+# Shared HTTP client, managed by http_create() and http_destroy()
+http: httpx.AsyncClient | None = None
+
+# Maximum number of concurrent connections to a single host
+http_host_limit: int = 8
+http_hosts: dict[str, Semaphore] = {}
+
+# Status code of the latest get() in the current context, 0 if no response
+http_status: ContextVar[int | None] = ContextVar("http_status", default=None)
+
+# Event loop time by which all get() requests in the current context must end
+http_deadline: ContextVar[float | None] = ContextVar("http_deadline", default=None)
+
+
+class Circuit(StrEnum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class Breaker:
+    """
+    Circuit breaker for a single host.
+
+    The circuit opens after repeated consecutive failures, rejecting
+    requests until the cooldown expires. A single probe request is then
+    allowed through, closing the circuit on success or reopening it on
+    failure.
+    """
+
+    threshold: int = 5
+    cooldown: float = 30.0
+
+    def __init__(self: Self, host: str) -> None:
+        """Initialize a closed circuit for the provided host."""
+
+        self.host: str = host
+        self.state: Circuit = Circuit.CLOSED
+        self.failures: int = 0
+        self.opened: float = 0.0
+
+    def allow(self: Self) -> bool:
+        """Determine whether a request to the host may be attempted."""
+
+        if self.state == Circuit.CLOSED:
+            return True
+        elif self.state == Circuit.HALF_OPEN:
+            # Only the single probe request is allowed
+            return False
+        elif time.monotonic() - self.opened < self.cooldown:
+            return False
+
+        self.state = Circuit.HALF_OPEN
+
+        logger.debug(f"Circuit for {self.host} is half-open, probing")
+
+        return True
+
+    def success(self: Self) -> None:
+        """Record a successful request, closing the circuit."""
+
+        if self.state != Circuit.CLOSED:
+            logger.info(f"Circuit for {self.host} closed")
+
+        self.state = Circuit.CLOSED
+        self.failures = 0
+
+    def failure(self: Self) -> None:
+        """Record a failed request, opening the circuit if necessary."""
+
+        self.failures += 1
+
+        if (self.state == Circuit.HALF_OPEN) or (self.failures >= self.threshold):
+            if self.state != Circuit.OPEN:
+                logger.warning(
+                    f"Circuit for {self.host} opened after {self.failures:,} consecutive failures"
+                )
+
+            self.state = Circuit.OPEN
+            self.opened = time.monotonic()
+
+    def abandon(self: Self) -> None:
+        """Release an unfinished probe so that the next request may probe."""
+
+        if self.state == Circuit.HALF_OPEN:
+            self.state = Circuit.OPEN
+            self.opened = time.monotonic() - self.cooldown
+
+
+http_breakers: dict[str, Breaker] = {}
+
+
+# In-flight requests shared by single_flight(), keyed by request
+http_flights: dict[tuple[str, ...], asyncio.Task[Any]] = {}
+
+
+# Finished archive downloads, keyed by URL and scan parameters, alongside
+# their expiry, path and number sequences
+http_archives: dict[tuple[str, ...], tuple[float, str, set[int]]] = {}
+http_archive_size: int = 16
+http_archive_ttl: float = 3600.0
+
+
+async def single_flight[T](
+    key: tuple[str, ...], factory: Callable[[], Awaitable[T]]
+) -> T:
+    """
+    Await the coroutine created by the provided factory, sharing it with
+    all concurrent callers of the same key rather than starting another.
+    """
+
+    if flight := http_flights.get(key):
+        logger.debug("Joined in-flight request {}", key)
+    else:
+        flight = http_flights[key] = asyncio.create_task(factory())
+
+        flight.add_done_callback(lambda _: http_flights.pop(key, None))
+
+    # Shield the shared request from cancellation of any single caller
+    return await asyncio.shield(flight)
 
 
 def elapsed(a: datetime | int | float, b: datetime | int | float) -> int:
@@ -56,21 +198,60 @@ async def is_valid_user(userId: int, client: GatewayClient) -> bool:
     Discord user ID.
     """
 
-    try:
-        logger.debug(
-            f"Validated {userId} as user {(await client.rest.fetch_user(userId)).username}"
-        )
-    except Exception as e:
-        logger.opt(exception=e).debug(f"Invalidated potential user ID {userId}")
+    return userId in await valid_users([userId], client)
 
-        return False
 
-    return True
+async def valid_users(userIds: Iterable[int], client: GatewayClient) -> list[int]:
+    """
+    Return the provided integers which are valid Discord user IDs, in
+    order and without duplicates.
+
+    The gateway cache and previous results are consulted first, then the
+    remaining IDs are validated concurrently via REST.
+    """
+
+    candidates: list[int] = list(dict.fromkeys(userIds))
+    unknown: list[int] = []
+    results: set[int] = set()
+
+    for userId in candidates:
+        if (userId in users_valid) or client.cache.get_user(userId):
+            results.add(userId)
+        elif userId not in users_invalid:
+            unknown.append(userId)
+
+    async def validate(userId: int) -> None:
+        async with users_limit:
+            try:
+                user: User = await client.rest.fetch_user(userId)
+            except NotFoundError as e:
+                logger.opt(exception=e).debug(f"Invalidated potential user ID {userId}")
+
+                users_invalid.set(userId, True)
+
+                return
+            except Exception as e:
+                logger.opt(exception=e).debug(f"Failed to validate user ID {userId}")
+
+                return
+
+        logger.debug(f"Validated {userId} as user {user.username}")
+
+        users_valid.set(userId, True)
+        results.add(userId)
+
+    await asyncio.gather(*(validate(userId) for userId in unknown))
+
+    logger.debug(
+        f"Validated {len(results):,} of {len(candidates):,} potential user IDs ({len(unknown):,} via REST)"
+    )
+
+    return [userId for userId in candidates if userId in results]
 
 
 async def user_has_role(
     userId: int,
-    roleIds: int | list[int],
+    roleIds: int | list[int] | frozenset[int],
     serverId: int,
     client: GatewayClient,
 ) -> bool:
@@ -79,18 +260,19 @@ async def user_has_role(
     member has a specified role.
 
     If an array of role IDs is provided, return True upon first
-    successful match.
+    successful match. The member is read from the gateway cache when
+    available and fetched otherwise.
     """
 
-    user: Member | None = None
-    server: Guild = await client.rest.fetch_guild(serverId)
+    user: Member | None = client.cache.get_member(serverId, userId)
 
     # Accept both a singular int or array of integers.
     if isinstance(roleIds, int):
         roleIds = [roleIds]
 
     try:
-        user = await client.rest.fetch_member(serverId, userId)
+        if not user:
+            user = await client.rest.fetch_member(serverId, userId)
     except NotFoundError as e:
         logger.opt(exception=e).trace(
             f"Failed to locate member {userId} in server {serverId}"
@@ -104,40 +286,369 @@ async def user_has_role(
         for role in user.role_ids:
             if (current := int(role)) in roleIds:
                 logger.debug(
-                    f"{await expand_user(user.user, format=False)} has role {current} in server {await expand_server(server, format=False)}"
+                    "Member {} has role {} in server {}", userId, current, serverId
                 )
 
                 return True
 
         logger.debug(
-            f"{await expand_user(user.user, format=False)} does not have role(s) {roleIds} in server {await expand_server(server, format=False)}"
+            "Member {} does not have role(s) {} in server {}", userId, roleIds, serverId
         )
 
     return False
 
 
+async def http_create() -> httpx.AsyncClient:
+    """
+    Create the shared HTTP client used by get().
+
+    Connections are pooled and kept alive between requests. HTTP/2 is
+    enabled when the optional h2 package is installed.
+    """
+
+    global http
+
+    if http:
+        return http
+
+    http2: bool = find_spec("h2") is not None
+    http = httpx.AsyncClient(
+        follow_redirects=True,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=64, max_keepalive_connections=16, keepalive_expiry=30.0
+        ),
+    )
+
+    logger.debug(f"Created shared HTTP client (HTTP/2: {http2})")
+
+    return http
+
+
+async def http_destroy() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+
+    global http
+
+    if not http:
+        return
+
+    try:
+        await http.aclose()
+    except Exception as e:
+        logger.opt(exception=e).warning("Failed to close shared HTTP client")
+
+    http = None
+
+    http_hosts.clear()
+
+    archives_prune(0)
+
+
+@asynccontextmanager
+async def deadline(seconds: float) -> AsyncIterator[None]:
+    """
+    Bound the total time spent on all get() requests, including retries,
+    within the context to the provided number of seconds.
+
+    Raises TimeoutError if the deadline is exceeded.
+    """
+
+    token = http_deadline.set(asyncio.get_running_loop().time() + seconds)
+
+    try:
+        async with asyncio.timeout(seconds):
+            yield
+    finally:
+        http_deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Return the seconds remaining before the current deadline, if any."""
+
+    if (end := http_deadline.get()) is None:
+        return
+
+    return end - asyncio.get_running_loop().time()
+
+
+def retry_after(res: Response) -> float | None:
+    """Return the delay in seconds requested by a Retry-After header."""
+
+    if not (value := res.headers.get("Retry-After")):
+        return
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except Exception as e:
+        logger.opt(exception=e).debug(f"Failed to parse Retry-After header {value}")
+
+
 async def get(
-    url: str, headers: dict[str, str] | None = None
+    url: str, headers: dict[str, str] | None = None, *, retries: int = 2
 ) -> dict[str, Any] | list[Any] | str | None:
-    """Perform an HTTP GET request and return its response."""
+    """
+    Perform an HTTP GET request and return its response.
+
+    Transport errors, rate limits, and server errors are retried with
+    jittered exponential backoff, honoring Retry-After and the current
+    deadline. Requests to a host with an open circuit fail immediately.
+    """
 
     logger.debug(f"GET {url}")
 
-    try:
-        async with httpx.AsyncClient() as http:
-            res: Response = await http.get(url, headers=headers, follow_redirects=True)
+    client: httpx.AsyncClient = http or await http_create()
+    host: str = urlsplit(url).netloc
+
+    if not (limit := http_hosts.get(host)):
+        limit = http_hosts[host] = Semaphore(http_host_limit)
+
+    if not (breaker := http_breakers.get(host)):
+        breaker = http_breakers[host] = Breaker(host)
+
+    res: Response | None = None
+    attempt: int = 0
+
+    while True:
+        http_status.set(0)
+
+        if not breaker.allow():
+            logger.debug(f"Skipped GET {url}, circuit for {host} is {breaker.state}")
+
+            return
+
+        delay: float | None = None
+        timeout: float = 5.0
+        capped: bool = False
+
+        if ((left := remaining()) is not None) and (left < timeout):
+            timeout = max(left, 0.0)
+            capped = True
+
+        try:
+            async with limit:
+                res = await client.get(url, headers=headers, timeout=timeout)
+
+            http_status.set(res.status_code)
+
+            if (res.status_code == 429) or (res.status_code >= 500):
+                breaker.failure()
+
+                delay = retry_after(res)
+            else:
+                breaker.success()
+
+            res.raise_for_status()
 
-        res.raise_for_status()
+            logger.trace(res.text)
 
-        logger.trace(res.text)
+            break
+        except asyncio.CancelledError:
+            breaker.abandon()
+
+            raise
+        except httpx.HTTPStatusError as e:
+            if (res.status_code != 429) and (res.status_code < 500):
+                logger.opt(exception=e).error(f"Failed to GET {url}")
+
+                return
+
+            error: Exception = e
+        except httpx.TransportError as e:
+            # Running out of the caller's deadline is not the host's fault
+            if capped and isinstance(e, httpx.TimeoutException):
+                breaker.abandon()
+            else:
+                breaker.failure()
+
+            error = e
+        except Exception as e:
+            breaker.abandon()
+
+            logger.opt(exception=e).error(f"Failed to GET {url}")
+
+            return
+
+        if attempt >= retries:
+            logger.opt(exception=error).error(f"Failed to GET {url}")
+
+            return
+
+        # Full jitter exponential backoff, unless the server requested a delay
+        if delay is None:
+            delay = random.uniform(0.0, 0.25 * (2**attempt))
+
+        if ((left := remaining()) is not None) and (delay >= left):
+            logger.opt(exception=error).error(
+                f"Failed to GET {url}, retry in {delay:,.2f}s exceeds deadline"
+            )
+
+            return
+
+        attempt += 1
+
+        logger.debug(f"Retrying GET {url} in {delay:,.2f}s ({attempt}/{retries})")
+
+        await asyncio.sleep(delay)
+
+    result: dict[str, Any] | list[Any] | str = res.text
+
+    try:
+        result = res.json()
     except Exception as e:
-        logger.opt(exception=e).error(f"Failed to GET {url}")
+        logger.opt(exception=e).debug("Failed to parse response as JSON")
+
+    return result
+
+
+def archives_prune(size: int = http_archive_size) -> None:
+    """Remove expired archives and the oldest archives beyond the provided count."""
+
+    now: float = time.monotonic()
+
+    while http_archives:
+        key, (expires, path, _) = next(iter(http_archives.items()))
+
+        if (expires > now) and (len(http_archives) <= size):
+            break
+
+        del http_archives[key]
+
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.opt(exception=e).warning(f"Failed to remove {path}")
+
+
+async def download(
+    url: str, limit: int, minLen: int | None = None, maxLen: int | None = None
+) -> tuple[str, set[int]] | None:
+    """
+    Stream the response body of an HTTP GET request to a temporary file and
+    return its path, alongside all number sequences found in the body.
+
+    The body is never held in memory as a whole. Downloads exceeding the
+    provided limit in bytes are abandoned. Finished downloads are kept for
+    an hour and shared by concurrent requests of the same URL, each caller
+    receiving its own link to the file. The caller is responsible for
+    removing the returned file.
+    """
+
+    key: tuple[str, ...] = (url, str(limit), str(minLen), str(maxLen))
+
+    async def fetch() -> tuple[float, str, set[int]] | None:
+        if not (result := await stream(url, limit, minLen, maxLen)):
+            return
+
+        archive = http_archives[key] = (time.monotonic() + http_archive_ttl, *result)
+
+        archives_prune()
+
+        return archive
+
+    archives_prune()
+
+    if archive := http_archives.get(key):
+        logger.debug(f"GET {url} (cached)")
+    elif not (archive := await single_flight(("download", *key), fetch)):
+        return
+
+    _, shared, numbers = archive
+    descriptor, path = mkstemp(suffix=".txt")
+
+    os.close(descriptor)
+    os.remove(path)
+
+    try:
+        os.link(shared, path)
+    except OSError as e:
+        logger.opt(exception=e).error(f"Failed to link {shared} to {path}")
+
+        return
+
+    return path, set(numbers)
+
+
+async def stream(
+    url: str, limit: int, minLen: int | None, maxLen: int | None
+) -> tuple[str, set[int]] | None:
+    """Perform the streaming HTTP GET request on behalf of download()."""
+
+    logger.debug(f"GET {url} (streaming)")
+
+    client: httpx.AsyncClient = http or await http_create()
+    host: str = urlsplit(url).netloc
+
+    if not (breaker := http_breakers.get(host)):
+        breaker = http_breakers[host] = Breaker(host)
+
+    if not breaker.allow():
+        logger.debug(f"Skipped GET {url}, circuit for {host} is {breaker.state}")
 
         return
 
+    descriptor, path = mkstemp(suffix=".txt")
+    numbers: set[int] = set()
+    size: int = 0
+
+    def scan(data: bytes) -> None:
+        for entry in re.findall(rb"\d+", data):
+            if (minLen and len(entry) < minLen) or (maxLen and len(entry) > maxLen):
+                continue
+
+            numbers.add(int(entry))
+
     try:
-        return res.json()
+        with os.fdopen(descriptor, "wb") as file:
+            async with client.stream("GET", url) as res:
+                if (res.status_code == 429) or (res.status_code >= 500):
+                    breaker.failure()
+                else:
+                    breaker.success()
+
+                res.raise_for_status()
+
+                if int(res.headers.get("Content-Length", 0)) > limit:
+                    raise RuntimeError(f"response exceeds limit of {limit:,} bytes")
+
+                # Trailing digits of a chunk may continue in the next chunk
+                tail: bytes = b""
+
+                async for chunk in res.aiter_bytes():
+                    if (size := size + len(chunk)) > limit:
+                        raise RuntimeError(f"response exceeds limit of {limit:,} bytes")
+
+                    file.write(chunk)
+
+                    data: bytes = tail + chunk
+                    cut: int = len(data)
+
+                    while cut and data[cut - 1] in b"0123456789":
+                        cut -= 1
+
+                    scan(data[:cut])
+
+                    # An overlong sequence remains overlong, keep just enough
+                    tail = data[cut:][-((maxLen or len(data)) + 1) :]
+
+                scan(tail)
     except Exception as e:
-        logger.opt(exception=e).debug("Failed to parse response as JSON")
+        if isinstance(e, httpx.TransportError):
+            breaker.failure()
+        else:
+            breaker.abandon()
+
+        logger.opt(exception=e).error(f"Failed to GET {url}")
+
+        os.remove(path)
+
+        return
+
+    logger.debug(f"Downloaded {size:,} bytes from {url} to {path}")
 
-    return res.text
+    return path, numbers
@@ -0,0 +1,76 @@
+import arc
+from arc import GatewayClient, GatewayContext, GatewayPlugin
+from hikari import (
+    GuildChannelDeleteEvent,
+    GuildChannelUpdateEvent,
+    GuildLeaveEvent,
+    GuildThreadDeleteEvent,
+    GuildThreadUpdateEvent,
+    GuildUpdateEvent,
+    MemberUpdateEvent,
+)
+from loguru import logger
+
+from core.formatters import forget
+from core.hooks import hook_error
+
+plugin: GatewayPlugin = GatewayPlugin("entities")
+
+
+@arc.loader
+def extension_loader(client: GatewayClient) -> None:
+    """Required. Called upon loading the extension."""
+
+    logger.debug(f"Attempting to load {plugin.name} extension...")
+    logger.trace(plugin)
+
+    try:
+        client.add_plugin(plugin)
+    except Exception as e:
+        logger.opt(exception=e).error(f"Failed to load {plugin.name} extension")
+
+
+@plugin.listen()
+async def event_member_update(event: MemberUpdateEvent) -> None:
+    """Handler for invalidating cached expansions of an updated user."""
+
+    forget("user", event.user_id)
+
+
+@plugin.listen()
+async def event_server_update(event: GuildUpdateEvent) -> None:
+    """Handler for invalidating cached expansions of an updated server."""
+
+    forget("server", event.guild_id)
+
+
+@plugin.listen()
+async def event_server_leave(event: GuildLeaveEvent) -> None:
+    """Handler for invalidating cached expansions of a departed server."""
+
+    forget("server", event.guild_id)
+
+
+@plugin.listen()
+async def event_channel_update(
+    event: GuildChannelUpdateEvent | GuildChannelDeleteEvent,
+) -> None:
+    """Handler for invalidating cached expansions of a changed channel."""
+
+    forget("channel", event.channel_id)
+
+
+@plugin.listen()
+async def event_thread_update(
+    event: GuildThreadUpdateEvent | GuildThreadDeleteEvent,
+) -> None:
+    """Handler for invalidating cached expansions of a changed thread."""
+
+    forget("channel", event.thread_id)
+
+
+@plugin.set_error_handler
+async def error_handler(ctx: GatewayContext, error: Exception) -> None:
+    """Handler for errors originating from this plugin."""
+
+    await hook_error(ctx, error)
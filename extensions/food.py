@@ -1,5 +1,4 @@
 import random
-from asyncio import sleep
 
 import arc
 from arc import (
@@ -12,18 +11,13 @@ from arc import (
 from hikari import Embed
 from loguru import logger
 
-from core.food import foodish
+from core.config import Config
+from core.food import foodPrefetch, foodSources
 from core.hooks import hook_error, hook_log
+from core.utils import deadline
 
 plugin: GatewayPlugin = GatewayPlugin("food")
-foodTypes: list[str] = [
-    "Burger",
-    "Chicken",
-    "Dessert",
-    "Pasta",
-    "Pizza",
-    "Rice",
-]
+foodTypes: list[str] = list(foodSources)
 
 
 @arc.loader
@@ -51,40 +45,27 @@ async def command_food(
 ) -> None:
     """Handler for the /food command."""
 
-    result: Embed | None = None
-    retries: int = 0
-
-    while not result:
-        match type:
-            case "Burger":
-                result = await foodish("burger")
-            case "Chicken":
-                result = await foodish("butter-chicken")
-            case "Dessert":
-                result = await foodish("dessert")
-            case "Pasta":
-                result = await foodish("pasta")
-            case "Pizza":
-                result = await foodish("pizza")
-            case "Rice":
-                result = await foodish("rice")
-            case _:
-                # type is expected to be null if not provided
-                if type:
-                    logger.warning(f"Recieved unknown food type {type}")
-
-                type = random.choice(foodTypes)
-
-                continue
-
-        if not result:
-            retries += 1
-
-            if retries >= 3:
-                raise RuntimeError("maximum retries exceeded")
-
-            # Sleep to prevent rate-limiting
-            await sleep(1)
+    # type is expected to be null if not provided
+    if type not in foodSources:
+        if type:
+            logger.warning(f"Recieved unknown food type {type}")
+
+        type = random.choice(foodTypes)
+
+    cfg: Config = ctx.client.get_type_dependency(Config)
+    result: Embed | None = foodPrefetch.pop(type)
+
+    if not result:
+        try:
+            async with deadline(cfg.prefetch_deadline):
+                result = await foodPrefetch.race(type, cfg.prefetch_hedge)
+        except TimeoutError:
+            logger.warning(
+                f"Exceeded deadline of {cfg.prefetch_deadline:,}s for food type {type}"
+            )
+
+    if not result:
+        raise RuntimeError("all sources failed")
 
     await ctx.respond(embed=result)
 
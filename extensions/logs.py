@@ -1,4 +1,6 @@
-from typing import Any
+import os
+from re import Match
+from typing import Sequence
 
 import arc
 from arc import GatewayClient, GatewayContext, GatewayPlugin
@@ -11,16 +13,15 @@ from hikari import (
     GuildMessageCreateEvent,
     InteractionCreateEvent,
     InteractionType,
-    LazyIterator,
     Message,
     MessageFlag,
     PartialInteraction,
     ResponseType,
 )
-from hikari.files import Bytes
+from hikari.files import Bytes, File
 from loguru import logger
-from urlextract import URLExtract  # type: ignore
 
+from core.archives import Archives
 from core.config import Config
 from core.formatters import (
     Colors,
@@ -33,8 +34,11 @@ from core.formatters import (
     log,
     response,
 )
+from core.history import Entry, History
 from core.hooks import hook_error
-from core.utils import find_numbers, get, is_valid_user
+from core.keywords import Keywords
+from core.transcript import Transcript
+from core.utils import download, valid_users
 
 plugin: GatewayPlugin = GatewayPlugin("logs")
 
@@ -51,6 +55,11 @@ def extension_loader(client: GatewayClient) -> None:
     except Exception as e:
         logger.opt(exception=e).error(f"Failed to load {plugin.name} extension")
 
+    cfg: Config = client.get_type_dependency(Config)
+
+    client.set_type_dependency(Keywords, Keywords(cfg.logs_keywords))
+    client.set_type_dependency(Archives, Archives())
+
 
 @plugin.listen()
 async def event_direct_message(event: DMMessageCreateEvent) -> None:
@@ -106,45 +115,26 @@ async def event_direct_message(event: DMMessageCreateEvent) -> None:
     )
 
 
-@plugin.listen()
-async def event_keyword(event: GuildMessageCreateEvent) -> None:
-    """Handler for notifying of keyword mentions."""
-
-    cfg: Config = plugin.client.get_type_dependency(Config)
-
-    if not event.is_human:
-        logger.trace("Ignored message creation event, author is not a human")
-
-        return
-    elif event.author.is_system:
-        logger.trace("Ignored message creation event, author is system")
-
-        return
-    elif not event.content:
-        logger.trace("Ignored message creation event, content is null")
+async def event_keyword(
+    event: GuildMessageCreateEvent, cfg: Config, content: str
+) -> None:
+    """
+    Handler for notifying of keyword mentions.
 
-        return
-    elif event.channel_id in cfg.logs_ignore_channels:
-        logger.trace("Ignored message creation event, channel is ignored")
+    Called by the message pipeline for human messages with content outside
+    of ignored channels.
+    """
 
-        return
+    keywords: Keywords = plugin.client.get_type_dependency(Keywords)
+    matches: list[Match[str]] = keywords.find(content)
 
-    words: list[str] = [word.lower() for word in event.content.split()]
-    found: list[str] = []
-
-    for keyword in cfg.logs_keywords:
-        if keyword in words:
-            found.append(keyword)
-
-    if len(found) == 0:
+    if len(matches) == 0:
         logger.trace("Ignored message creation event, no keywords found")
 
         return
 
-    content: str = event.content
-
-    for keyword in found:
-        content = content.replace(keyword, f"**{keyword}**")
+    found: list[str] = keywords.names(matches)
+    content = keywords.highlight(content, matches)
 
     logger.trace(content)
 
@@ -200,31 +190,22 @@ async def event_keyword(event: GuildMessageCreateEvent) -> None:
     )
 
 
-@plugin.listen()
-async def event_mention(event: GuildMessageCreateEvent) -> None:
-    """Handler for notifying of user mentions."""
-
-    if not event.is_human:
-        logger.trace("Ignored message creation event, author is not human")
+async def event_mention(
+    event: GuildMessageCreateEvent, cfg: Config, content: str
+) -> None:
+    """
+    Handler for notifying of user mentions.
 
-        return
-    elif not event.content:
-        logger.trace("Ignored message creation event, content is null")
-
-        return
-    elif not event.message.user_mentions_ids:
-        logger.trace("Ignored message creation event, no user mentions")
-
-        return
-    elif reply_to := event.message.referenced_message:
-        cfg: Config = plugin.client.get_type_dependency(Config)
+    Called by the message pipeline for human messages with content which
+    mention at least one of the configured users.
+    """
 
+    if reply_to := event.message.referenced_message:
         if reply_to.content and reply_to.content == cfg.forums_greeting:
             logger.trace("Ignored message creation event, reply to forum greeting")
 
             return
 
-    cfg: Config = plugin.client.get_type_dependency(Config)
     found: list[int] = []
 
     for userId in cfg.logs_mentions:
@@ -272,7 +253,7 @@ async def event_mention(event: GuildMessageCreateEvent) -> None:
             title=("User" if len(found) == 1 else "Users") + " Mentioned",
             url=event.message.make_link(event.guild_id),
             color=Colors.N31L_GREEN,
-            description=f">>> {event.content}",
+            description=f">>> {content}",
             author=await expand_user(event.author, format=False, show_id=False),
             authorIcon=get_user_avatar(event.author),
             footer=str(event.author_id),
@@ -287,6 +268,52 @@ async def event_mention(event: GuildMessageCreateEvent) -> None:
     )
 
 
+async def fetch_context(
+    channel_id: int, message_id: int, direction: str, limit: int
+) -> list[Message | Entry]:
+    """
+    Return up to limit messages before or after the specified message in
+    chronological order.
+
+    Messages are answered from the recorded channel history, and fetched
+    via REST only to fill in what was not recorded.
+    """
+
+    history: History = plugin.client.get_type_dependency(History)
+
+    if direction == "after":
+        if (recorded := history.after(channel_id, message_id, limit)) is not None:
+            logger.trace("Answered context after {} from history", message_id)
+
+            return list(recorded)
+
+        return list(
+            await plugin.client.rest.fetch_messages(channel_id, after=message_id).limit(
+                limit
+            )
+        )
+
+    results: list[Message | Entry] = list(
+        history.before(channel_id, message_id, limit) or []
+    )
+
+    if len(results) >= limit:
+        logger.trace("Answered context before {} from history", message_id)
+
+        return results
+
+    anchor: int = results[0].id if results else message_id
+
+    # Reverse iterator to maintain chronological order
+    backfill: Sequence[Message] = (
+        await plugin.client.rest.fetch_messages(channel_id, before=anchor)
+        .limit(limit - len(results))
+        .reversed()
+    )
+
+    return [*backfill, *results]
+
+
 @plugin.listen()
 async def event_context(event: InteractionCreateEvent) -> None:
     """Handler for the Context and Aftermath button commands."""
@@ -295,23 +322,23 @@ async def event_context(event: InteractionCreateEvent) -> None:
     display_name: str = expand_interaction(interaction, format=False)
 
     if not interaction.type == InteractionType.MESSAGE_COMPONENT:
-        logger.trace(f"Ignored {display_name}, expected MESSAGE_COMPONENT")
+        logger.trace("Ignored {}, expected MESSAGE_COMPONENT", display_name)
 
         return
     elif not isinstance(interaction, ComponentInteraction):
-        logger.trace(f"Ignored {display_name}, expected ComponentInteraction")
+        logger.trace("Ignored {}, expected ComponentInteraction", display_name)
 
         return
     elif not hasattr(interaction, "custom_id"):
-        logger.trace(f"Ignored {display_name}, expected custom_id")
+        logger.trace("Ignored {}, expected custom_id", display_name)
 
         return
     elif not (btnId := interaction.custom_id):
-        logger.trace(f"Ignored {display_name}, custom_id is null")
+        logger.trace("Ignored {}, custom_id is null", display_name)
 
         return
     elif (btnId != "before") and (btnId != "after"):
-        logger.trace(f"Ignored {display_name}, expected custom_id before or after")
+        logger.trace("Ignored {}, expected custom_id before or after", display_name)
 
         return
 
@@ -323,30 +350,12 @@ async def event_context(event: InteractionCreateEvent) -> None:
     target_id: int = int(target.split("/")[-1])
     target_channel: int = int(target.split("/")[-2])
 
-    context: LazyIterator[Message] | None = None
-
-    if btnId == "before":
-        context = event.app.rest.fetch_messages(target_channel, before=target_id)
-    elif btnId == "after":
-        context = event.app.rest.fetch_messages(target_channel, after=target_id)
-
-    if not context:
-        raise RuntimeError("context is null")
-
-    # Discord limitation is 10 embeds
-    # https://discord.com/developers/docs/resources/message#create-message-jsonform-params
-    context = context.limit(10)
-
-    # Reverse iterator to maintain chronological order
-    if btnId == "before":
-        context = context.reversed()
-
-    logger.trace(context)
-
     results: list[Embed] = []
 
     try:
-        for message in await context:
+        # Discord limitation is 10 embeds
+        # https://discord.com/developers/docs/resources/message#create-message-jsonform-params
+        for message in await fetch_context(target_channel, target_id, btnId, 10):
             logger.trace(message)
 
             fields: list[dict[str, str | bool]] = []
@@ -413,23 +422,23 @@ async def event_dump(event: InteractionCreateEvent) -> None:
     display_name: str = expand_interaction(interaction, format=False)
 
     if not interaction.type == InteractionType.MESSAGE_COMPONENT:
-        logger.trace(f"Ignored {display_name}, expected MESSAGE_COMPONENT")
+        logger.trace("Ignored {}, expected MESSAGE_COMPONENT", display_name)
 
         return
     elif not isinstance(interaction, ComponentInteraction):
-        logger.trace(f"Ignored {display_name}, expected ComponentInteraction")
+        logger.trace("Ignored {}, expected ComponentInteraction", display_name)
 
         return
     elif not hasattr(interaction, "custom_id"):
-        logger.trace(f"Ignored {display_name}, expected custom_id")
+        logger.trace("Ignored {}, expected custom_id", display_name)
 
         return
     elif not (btnId := interaction.custom_id):
-        logger.trace(f"Ignored {display_name}, custom_id is null")
+        logger.trace("Ignored {}, custom_id is null", display_name)
 
         return
     elif btnId != "dump":
-        logger.trace(f"Ignored {display_name}, expected custom_id dump")
+        logger.trace("Ignored {}, expected custom_id dump", display_name)
 
         return
 
@@ -441,57 +450,21 @@ async def event_dump(event: InteractionCreateEvent) -> None:
     target_id: int = int(target.split("/")[-1])
     target_channel: int = int(target.split("/")[-2])
 
-    context: list[Message] = []
-    before: LazyIterator[Message] = event.app.rest.fetch_messages(
-        target_channel, before=target_id
-    ).limit(100)
-    after: LazyIterator[Message] = event.app.rest.fetch_messages(
-        target_channel, after=target_id
-    ).limit(100)
+    context: list[Message | Entry] = []
 
     try:
-        # Reverse iterator to maintain chronological order
-        for message in await before.reversed():
-            context.append(message)
+        context += await fetch_context(target_channel, target_id, "before", 100)
     except Exception as e:
         logger.opt(exception=e).error("Failed to fetch message(s) in context")
 
     try:
-        for message in await after:
-            context.append(message)
+        context += await fetch_context(target_channel, target_id, "after", 100)
     except Exception as e:
         logger.opt(exception=e).error("Failed to fetch message(s) in context")
 
     logger.trace(context)
 
-    result: str = ""
-
-    for message in context:
-        logger.trace(message)
-
-        result += f"{await expand_user(message.author, format=False)}"
-        result += f" at {message.timestamp}"
-
-        if content := message.content:
-            result += f"\n{content}"
-
-        if attachments := message.attachments:
-            for attachment in attachments:
-                result += f"\n{attachment.url}"
-
-        if stickers := message.stickers:
-            for sticker in stickers:
-                result += f"\n{sticker.make_url()}"
-
-        if embeds := message.embeds:
-            for embed in embeds:
-                result += f"\n{embed}"
-
-        result += "\n\n"
-
-    logger.trace(result)
-
-    if result == "":
+    if not context:
         await interaction.edit_initial_response(
             embed=response(
                 description="No context found for message.",
@@ -501,68 +474,43 @@ async def event_dump(event: InteractionCreateEvent) -> None:
 
         return
 
+    transcript: Transcript = Transcript(context)
+    filename: str = f"dump_{target_id}"
+
     await interaction.edit_initial_response(
-        attachment=Bytes(result, f"dump_{target_id}.txt")
+        attachments=[
+            Bytes(transcript.render(format), f"{filename}.{format}")
+            for format in ["txt", "jsonl"]
+        ]
     )
 
 
-@plugin.listen()
-async def event_mirror(event: GuildMessageCreateEvent) -> None:
-    """Handler for automatically mirroring Zeppelin log archives."""
+async def event_mirror(
+    event: GuildMessageCreateEvent, cfg: Config, content: str
+) -> None:
+    """
+    Handler for automatically mirroring Zeppelin log archives.
 
-    if event.is_human:
-        logger.trace("Ignored message creation event, author is not a bot")
+    Called by the message pipeline for messages with content from bots
+    other than N31L in the moderation channel.
+    """
 
-        return
-    elif not event.content:
-        logger.trace("Ignored message creation event, content is null")
+    archives: Archives = plugin.client.get_type_dependency(Archives)
 
-        return
-
-    bot: GatewayBot = plugin.client.get_type_dependency(GatewayBot)
-    cfg: Config = plugin.client.get_type_dependency(Config)
-
-    if not (n31l := bot.get_me()):
-        raise RuntimeError("Bot user is null")
-
-    if event.channel_id != cfg.channels["moderation"]:
-        logger.trace("Ignored message creation event, channel is not desired")
-
-        return
-    elif event.author_id == n31l.id:
-        logger.trace("Ignored message creation event, author is N31L")
-
-        return
-
-    for url in URLExtract().find_urls(event.content.lower(), True):
-        if not isinstance(url, str):
-            logger.debug(f"Skipping URL {url}, recieved {type(url)} expected string")
-
-            continue
-
-        if not url.startswith("https://api.zeppelin.gg/archives/"):
-            continue
-
-        data: dict[str, Any] | list[Any] | str | None = await get(url)
+    for url, filename in archives.find(content):
+        archive: tuple[str, set[int]] | None = await download(
+            url, cfg.logs_archive_limit, 17, 19
+        )
 
-        if not data:
-            logger.debug(f"Skipping URL {url}, data is null")
+        if not archive:
+            logger.debug("Skipping URL {}, archive is null", url)
 
             continue
-        elif not isinstance(data, str):
-            logger.debug(f"Skipping URL {url}, expected string response")
 
-            continue
-
-        found: list[str] = []
-
-        for line in data.splitlines():
-            for find in find_numbers(line, 17, 19):
-                if await is_valid_user(find, plugin.client):
-                    found.append(f"`{find}`")
-
-        # Ensure there are no duplicate users
-        found: list[str] = list(set(found))
+        path, numbers = archive
+        found: list[str] = [
+            f"`{userId}`" for userId in await valid_users(numbers, plugin.client)
+        ]
 
         result: str = f"Mirror of Zeppelin log archive <{url}>"
 
@@ -570,21 +518,16 @@ async def event_mirror(event: GuildMessageCreateEvent) -> None:
             result += f" ({', '.join(found)})"
 
         result = log("mirror", result)
-        filename: str = "archive"
 
         try:
-            filename = url.split("/")[-1]
-        except Exception as e:
-            logger.opt(exception=e).warning(
-                "Failed to determine Zeppelin log archive filename"
+            await plugin.client.rest.create_message(
+                cfg.channels["moderation"],
+                result,
+                attachment=File(path, f"{filename}.txt"),
+                reply=event.message,
             )
-
-        await plugin.client.rest.create_message(
-            cfg.channels["moderation"],
-            result,
-            attachment=Bytes(data, f"{filename}.txt"),
-            reply=event.message,
-        )
+        finally:
+            os.remove(path)
 
         logger.success(f"Mirrored Zeppelin log archive {url}")
 
@@ -28,7 +28,7 @@ from core.formatters import (
     time_relative,
 )
 from core.hooks import hook_error, hook_log
-from core.utils import find_numbers, is_valid_user
+from core.utils import find_numbers, valid_users
 
 plugin: GatewayPlugin = GatewayPlugin("messages")
 
@@ -152,12 +152,8 @@ async def command_parse(ctx: GatewayContext, msg: Message) -> None:
                 for find in find_numbers(footer, sMin, sMax):
                     results.append(find)
 
-    # Remove duplicates from results
-    results = list(set(results))
-
-    for result in results:
-        if not await is_valid_user(result, ctx.client):
-            results.remove(result)
+    # Remove duplicates and invalid users from results
+    results = await valid_users(results, ctx.client)
 
     if len(results) == 0:
         await ctx.respond(
@@ -0,0 +1,133 @@
+import asyncio
+from typing import Coroutine
+
+import arc
+from arc import GatewayClient, GatewayContext, GatewayPlugin
+from hikari import (
+    GatewayBot,
+    GuildBulkMessageDeleteEvent,
+    GuildMessageCreateEvent,
+    GuildMessageDeleteEvent,
+    GuildMessageUpdateEvent,
+    ShardReadyEvent,
+)
+from loguru import logger
+
+from core.config import Config
+from core.history import History
+from core.hooks import hook_error
+from extensions.logs import event_keyword, event_mention, event_mirror
+from extensions.roles import event_validate_roles
+
+plugin: GatewayPlugin = GatewayPlugin("pipeline")
+
+
+@arc.loader
+def extension_loader(client: GatewayClient) -> None:
+    """Required. Called upon loading the extension."""
+
+    logger.debug(f"Attempting to load {plugin.name} extension...")
+    logger.trace(plugin)
+
+    try:
+        client.add_plugin(plugin)
+    except Exception as e:
+        logger.opt(exception=e).error(f"Failed to load {plugin.name} extension")
+
+    cfg: Config = client.get_type_dependency(Config)
+
+    client.set_type_dependency(History, History(cfg.logs_history))
+
+
+@plugin.listen()
+async def event_message(event: GuildMessageCreateEvent) -> None:
+    """
+    Handler for routing server messages to the applicable stages.
+
+    Shared filters are evaluated once per message, and only the stages
+    which apply to the message are run.
+    """
+
+    plugin.client.get_type_dependency(History).add(event.message)
+
+    cfg: Config = plugin.client.get_type_dependency(Config)
+    content: str | None = event.content
+    stages: list[Coroutine[None, None, None]] = []
+
+    if event.is_human:
+        if event.message.member and cfg.roles_mode == "message":
+            stages.append(event_validate_roles(event, cfg))
+
+        if content:
+            if (not event.author.is_system) and (
+                event.channel_id not in cfg.logs_ignore_channels
+            ):
+                stages.append(event_keyword(event, cfg, content))
+
+            if (mentions := event.message.user_mentions_ids) and (
+                not cfg.logs_mentions.isdisjoint(mentions)
+            ):
+                stages.append(event_mention(event, cfg, content))
+    elif content and (event.channel_id == cfg.channels["moderation"]):
+        bot: GatewayBot = plugin.client.get_type_dependency(GatewayBot)
+
+        if not (n31l := bot.get_me()):
+            raise RuntimeError("Bot user is null")
+
+        if event.author_id != n31l.id:
+            stages.append(event_mirror(event, cfg, content))
+
+    if not stages:
+        return
+    elif len(stages) == 1:
+        await stages[0]
+
+        return
+
+    for result in await asyncio.gather(*stages, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.opt(exception=result).error(
+                "Failed to handle message creation event"
+            )
+
+
+@plugin.listen()
+async def event_message_update(event: GuildMessageUpdateEvent) -> None:
+    """Handler for applying message edits to the recorded history."""
+
+    plugin.client.get_type_dependency(History).edit(event.message)
+
+
+@plugin.listen()
+async def event_message_delete(event: GuildMessageDeleteEvent) -> None:
+    """Handler for removing deleted messages from the recorded history."""
+
+    plugin.client.get_type_dependency(History).delete(
+        event.channel_id, [event.message_id]
+    )
+
+
+@plugin.listen()
+async def event_message_bulk_delete(event: GuildBulkMessageDeleteEvent) -> None:
+    """Handler for removing bulk deleted messages from the recorded history."""
+
+    plugin.client.get_type_dependency(History).delete(
+        event.channel_id, list(event.message_ids)
+    )
+
+
+@plugin.listen()
+async def event_shard_ready(event: ShardReadyEvent) -> None:
+    """
+    Handler for discarding the recorded history upon a new gateway session,
+    so that context missed while disconnected is fetched instead.
+    """
+
+    plugin.client.get_type_dependency(History).clear()
+
+
+@plugin.set_error_handler
+async def error_handler(ctx: GatewayContext, error: Exception) -> None:
+    """Handler for errors originating from this plugin."""
+
+    await hook_error(ctx, error)
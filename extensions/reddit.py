@@ -1,3 +1,5 @@
+import asyncio
+
 import arc
 from arc import (
     GatewayClient,
@@ -7,33 +9,23 @@ from arc import (
     SlashGroup,
     StrParams,
 )
-from asyncpraw.reddit import Reddit
 from loguru import logger
 
 from core.config import Config
-from core.formatters import response
+from core.formatters import response, time_relative
 from core.hooks import hook_error, hook_log
-from core.reddit import client_create, client_destroy, count_modqueue, count_unmoderated
+from core.reddit import (
+    Snapshot,
+    communities,
+    count_queues,
+    reddit_client,
+    snapshots,
+)
 
 plugin: GatewayPlugin = GatewayPlugin("reddit")
 group: SlashGroup[GatewayClient] = plugin.include_slash_group(
     "reddit", "Commands to manage Reddit communities."
 )
-communities: dict[str, str] = {
-    "r/CODBlackOps7": "CODBlackOps7",
-    "r/BlackOps6": "BlackOps6",
-    "r/ModernWarfareIII": "ModernWarfareIII",
-    "r/ModernWarfareII": "ModernWarfareII",
-    "r/CODVanguard": "CODVanguard",
-    "r/BlackOpsColdWar": "BlackOpsColdWar",
-    "r/CODWarzone": "CODWarzone",
-    "r/ModernWarfare": "ModernWarfare",
-    "r/BlackOps4": "BlackOps4",
-    "r/WWII": "WWII",
-    "r/InfiniteWarfare": "InfiniteWarfare",
-    "r/CODZombies": "CODZombies",
-    "r/CallofDuty": "CallofDuty",
-}
 
 
 @arc.loader
@@ -72,9 +64,7 @@ async def command_reddit_queue(
     if ctx.channel_id != cfg.channels["reddit"]:
         raise RuntimeError("Disallowed outside of designated Reddit channel")
 
-    client: Reddit | None = await client_create()
-
-    if not client:
+    if not (client := reddit_client()):
         raise RuntimeError("Reddit client is null")
 
     requested: list[str] | None = None
@@ -86,19 +76,42 @@ async def command_reddit_queue(
     else:
         requested = [community]
 
+    # Count communities live only until the first poll completes
+    missing: list[str] = [request for request in requested if request not in snapshots]
+
+    if missing:
+        counts: list[tuple[int, int] | None] = await asyncio.gather(
+            *(count_queues(client, request) for request in missing)
+        )
+
+        for request, count in zip(missing, counts):
+            if count:
+                snapshots[request] = Snapshot(request, *count)
+
     for request in requested:
-        mod: int = await count_modqueue(client, request)
-        unmod: int = await count_unmoderated(client, request)
+        if not (snapshot := snapshots.get(request)):
+            results.append(
+                {"name": f"r/{request}", "value": "Failed to fetch queue counts."}
+            )
+
+            continue
+
+        mod: str = f"[{snapshot.mod:,}](https://reddit.com/{request}/about/modqueue)"
+        unmod: str = (
+            f"[{snapshot.unmod:,}](https://reddit.com/{request}/about/unmoderated)"
+        )
+
+        if delta := snapshot.delta():
+            mod += f" ({delta[0]:+,})"
+            unmod += f" ({delta[1]:+,})"
 
         results.append(
             {
                 "name": f"r/{request}",
-                "value": f"Moderation: [{mod:,}](https://reddit.com/{request}/about/modqueue)\nUnmoderated: [{unmod:,}](https://reddit.com/{request}/about/unmoderated)",
+                "value": f"Moderation: {mod}\nUnmoderated: {unmod}\nUpdated {time_relative(snapshot.taken)}",
             }
         )
 
-    await client_destroy(client)
-
     await ctx.respond(
         embed=response(
             color="FF4500",
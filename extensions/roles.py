@@ -1,16 +1,22 @@
-from typing import Sequence
+import asyncio
+from asyncio import Semaphore
 
 import arc
 from arc import GatewayClient, GatewayContext, GatewayPlugin
-from hikari import GuildMessageCreateEvent, Snowflake
+from hikari import GuildMessageCreateEvent, Member, MemberChunkEvent, MemberUpdateEvent
 from loguru import logger
 
+from core.audit import Audit
 from core.config import Config
 from core.formatters import expand_server, expand_user, log
 from core.hooks import hook_error
+from core.roles import RolePolicy
 
 plugin: GatewayPlugin = GatewayPlugin("roles")
 
+# Concurrent member validations during a reconciliation sweep
+sweep_limit: Semaphore = Semaphore(4)
+
 
 @arc.loader
 def extension_loader(client: GatewayClient) -> None:
@@ -24,93 +30,142 @@ def extension_loader(client: GatewayClient) -> None:
     except Exception as e:
         logger.opt(exception=e).error(f"Failed to load {plugin.name} extension")
 
+    cfg: Config = client.get_type_dependency(Config)
+
+    client.set_type_dependency(RolePolicy, RolePolicy.from_config(cfg))
+
+
+async def event_validate_roles(event: GuildMessageCreateEvent, cfg: Config) -> None:
+    """
+    Handler for validating role requirements are met for members.
+
+    Called by the message pipeline for human messages from server members.
+    """
+
+    if not (member := event.message.member):
+        logger.trace("Ignoring message creation event, author is not a server member")
+
+        return
+
+    await validate_member(member, cfg)
+
 
 @plugin.listen()
-async def event_validate_roles(event: GuildMessageCreateEvent) -> None:
-    """Handler for validating role requirements are met for members."""
+async def event_member_update(event: MemberUpdateEvent) -> None:
+    """
+    Handler for validating role requirements are met for members whose
+    roles changed.
+
+    Only active when roles are validated upon member update.
+    """
 
-    if not event.is_human:
-        logger.trace("Ignoring message creation event, author is not human")
+    cfg: Config = plugin.client.get_type_dependency(Config)
 
+    if cfg.roles_mode != "member":
         return
-    elif not event.message.member:
-        logger.trace("Ignoring message creation event, author is not a server member")
+    elif not (member := event.member):
+        return
+    elif event.old_member and set(event.old_member.role_ids) == set(member.role_ids):
+        logger.trace("Ignored member update event, roles unchanged")
 
         return
 
+    await validate_member(member, cfg)
+
+
+@plugin.listen()
+async def event_member_chunk(event: MemberChunkEvent) -> None:
+    """
+    Handler for reconciling the roles of members received upon startup.
+
+    Only active when roles are validated upon member update.
+    """
+
     cfg: Config = plugin.client.get_type_dependency(Config)
-    equipped: Sequence[Snowflake] = event.message.member.role_ids
-    matches: list[int] = []
-    invalidated: list[int] = []
 
-    logger.trace(equipped)
+    if cfg.roles_mode != "member":
+        return
+
+    logger.debug(
+        "Reconciling roles of {:,} members in chunk {:,}/{:,}",
+        len(event.members),
+        event.chunk_index + 1,
+        event.chunk_count,
+    )
 
-    for role in equipped:
-        if role in cfg.roles_allow:
-            matches.append(role)
+    results: list[BaseException | None] = await asyncio.gather(
+        *(sweep_member(member, cfg) for member in event.members.values()),
+        return_exceptions=True,
+    )
 
-    logger.trace(matches)
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.opt(exception=result).error("Failed to reconcile member roles")
 
-    if len(matches) > 1:
-        for match in matches[1:]:
-            logger.trace(match)
 
-            await event.message.member.remove_role(
-                match, reason="Member exceeds the limit (1) of allowed roles."
-            )
+async def sweep_member(member: Member, cfg: Config) -> None:
+    """Validate the provided member, bounded by the sweep concurrency limit."""
 
-            await plugin.client.rest.create_message(
-                cfg.channels["user"],
-                log(
-                    "shirt",
-                    f"Removed role (`{match}`) from {await expand_user(event.author)} with reason: *Member exceeds limit (1) of allowed roles.*",
-                ),
-            )
+    async with sweep_limit:
+        await validate_member(member, cfg)
 
-            logger.success(
-                f"Invalidated role {match} for {await expand_user(event.author, format=False)} in {await expand_server(event.get_guild(), format=False)}"
-            )
 
-    # Refetch equipped roles before continuing validation
-    if member := event.get_member():
-        equipped = member.role_ids
+async def validate_member(member: Member, cfg: Config) -> None:
+    """
+    Remove the equipped roles of the provided member which violate the role
+    policy, removing a lone role individually and several in one update.
+    """
 
-        logger.trace(equipped)
+    policy: RolePolicy = plugin.client.get_type_dependency(RolePolicy)
 
-    for role in equipped:
-        logger.trace(role)
+    # Prefer the cached member, which reflects roles granted since the event
+    if current := plugin.client.cache.get_member(member.guild_id, member.id):
+        member = current
 
-        if role in cfg.roles_require:
-            logger.trace("Exiting role validation, user has a required role")
+    # The guild ID is the implicit @everyone role, which may not be edited
+    equipped: list[int] = [role for role in member.role_ids if role != member.guild_id]
 
-            return
+    if not policy.changed(member.guild_id, member.id, frozenset(equipped)):
+        logger.trace("Skipped role validation, roles unchanged since last validated")
 
-    for role in equipped:
-        logger.trace(role)
+        return
 
-        if role in cfg.roles_allow:
-            invalidated.append(role)
+    invalidated, reason = policy.diff(equipped)
 
     logger.trace(invalidated)
 
-    for role in invalidated:
-        logger.trace(role)
+    if not invalidated:
+        policy.remember(member.guild_id, member.id, frozenset(equipped))
 
-        await event.message.member.remove_role(
-            role, reason="Member does not meet the requirements to equip this role."
-        )
+        return
 
-        await plugin.client.rest.create_message(
-            cfg.channels["user"],
-            log(
-                "shirt",
-                f"Removed role (`{role}`) from {await expand_user(event.author)} with reason: *Requirements not met.*",
-            ),
-        )
+    remaining: list[int] = [role for role in equipped if role not in invalidated]
 
-        logger.success(
-            f"Invalidated role ({role}) for {await expand_user(event.author, format=False)} in {await expand_server(event.get_guild(), format=False)}"
+    # Removing a single role leaves concurrent role changes untouched
+    if len(invalidated) == 1:
+        await plugin.client.rest.remove_role_from_member(
+            member.guild_id, member.id, invalidated[0], reason=reason
         )
+    else:
+        await plugin.client.rest.edit_member(
+            member.guild_id, member.id, roles=remaining, reason=reason
+        )
+
+    policy.remember(member.guild_id, member.id, frozenset(remaining))
+
+    roles: str = ", ".join(f"`{role}`" for role in invalidated)
+
+    plugin.client.get_type_dependency(Audit).write(
+        cfg.channels["user"],
+        log(
+            "shirt",
+            f"Removed role{'s' if len(invalidated) > 1 else ''} ({roles}) from {await expand_user(member.user)} with reason: *{reason}*",
+        ),
+    )
+
+    logger.success(
+        f"Invalidated role(s) {invalidated} for {await expand_user(member.user, format=False)} in {await expand_server(member.get_guild(), format=False)}"
+    )
 
 
 @plugin.set_error_handler
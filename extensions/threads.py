@@ -1,17 +1,40 @@
 import asyncio
-from datetime import datetime
+import time
+from asyncio import Lock, Semaphore, Task
 
 import arc
 from arc import GatewayClient, GatewayPlugin
-from hikari import GuildThreadChannel, GuildThreadCreateEvent
+from hikari import (
+    GuildThreadChannel,
+    GuildThreadCreateEvent,
+    GuildThreadDeleteEvent,
+    GuildThreadUpdateEvent,
+    ShardReadyEvent,
+    Snowflake,
+)
 from loguru import logger
 
+from core.audit import Audit
 from core.config import Config
-from core.formatters import expand_server, expand_thread, expand_user, log
-from core.utils import elapsed, user_has_role
+from core.deadlines import Deadlines
+from core.formatters import expand_thread, expand_user, log
+from core.store import ThreadRecord, ThreadStore
+from core.utils import user_has_role
 
 plugin: GatewayPlugin = GatewayPlugin("threads")
 
+# Threads awaiting archival, keyed by thread ID
+tracked: dict[int, ThreadRecord] = {}
+deadlines: Deadlines = Deadlines()
+scheduler: Task[None] | None = None
+reconciling: Lock = Lock()
+
+# Seconds before rechecking a thread which could not be archived
+recheck: int = 600
+
+# Concurrent thread archive requests
+archive_limit: Semaphore = Semaphore(4)
+
 
 @arc.loader
 def extension_loader(client: GatewayClient) -> None:
@@ -25,6 +48,10 @@ def extension_loader(client: GatewayClient) -> None:
     except Exception as e:
         logger.opt(exception=e).error(f"Failed to load {plugin.name} extension")
 
+    cfg: Config = client.get_type_dependency(Config)
+
+    client.set_type_dependency(ThreadStore, ThreadStore(cfg.forums_database))
+
 
 @plugin.listen()
 async def event_thread_create(event: GuildThreadCreateEvent) -> None:
@@ -43,72 +70,291 @@ async def event_thread_create(event: GuildThreadCreateEvent) -> None:
 
         return
 
+    track_thread(event.thread, cfg)
+
     await event.thread.send(cfg.forums_greeting)
 
 
-@arc.utils.interval_loop(seconds=600)
-async def task_archive_threads(client: GatewayClient) -> None:
-    """Automatically archive threads in the configured channels."""
+@plugin.listen()
+async def event_thread_update(event: GuildThreadUpdateEvent) -> None:
+    """Handler for rescheduling archival upon thread updates."""
 
-    logger.info("Beginning recurring task to archive threads...")
+    track_thread(event.thread, plugin.client.get_type_dependency(Config))
 
-    cfg: Config = client.get_type_dependency(Config)
 
-    lifetime: int = cfg.forums_lifetime
-    threads: list[GuildThreadChannel] = list(
-        await client.rest.fetch_active_threads(cfg.forums_server)
-    )
+@plugin.listen()
+async def event_thread_delete(event: GuildThreadDeleteEvent) -> None:
+    """Handler for unscheduling archival upon thread deletion."""
 
-    for thread in threads:
-        title: str = expand_thread(thread, format=False)
+    untrack_thread(event.thread_id)
 
-        if thread.is_archived:
-            logger.debug(f"Skipped thread {title}, already archived")
 
-            continue
-        elif thread.parent_id not in cfg.forums_channels:
-            logger.debug(f"Skipped thread {title}, not in a configured forum channel")
+@plugin.listen()
+async def event_shard_ready(event: ShardReadyEvent) -> None:
+    """Handler for reconciling tracked threads after reconnecting."""
 
-            continue
-        elif elapsed(datetime.now(), thread.created_at) < lifetime:
-            logger.debug(f"Skipped thread {title}, maximum lifetime not exceeded")
+    # The scheduler reconciles upon starting, only catch up on later sessions
+    if not scheduler:
+        return
 
-            continue
-        elif await user_has_role(
-            thread.owner_id, cfg.forums_immune, thread.guild_id, client
+    await reconcile_threads(plugin.client, plugin.client.get_type_dependency(Config))
+
+
+def track_thread(thread: GuildThreadChannel, cfg: Config) -> None:
+    """Schedule the provided thread to be archived once its lifetime expires."""
+
+    if thread.guild_id != cfg.forums_server:
+        return
+    elif thread.parent_id not in cfg.forums_channels:
+        return
+    elif thread.is_archived:
+        untrack_thread(thread.id, archived=True)
+
+        return
+
+    if record := tracked.get(thread.id):
+        record.name = thread.name or record.name
+    else:
+        record = ThreadRecord.from_thread(thread, cfg.forums_lifetime)
+
+    schedule_thread(record)
+
+
+def schedule_thread(record: ThreadRecord) -> None:
+    """Schedule the provided thread record and persist it."""
+
+    tracked[record.id] = record
+
+    deadlines.schedule(record.id, record.due)
+
+    plugin.client.get_type_dependency(ThreadStore).save(record)
+
+
+def untrack_thread(threadId: int, *, archived: bool = False) -> None:
+    """Unschedule archival of the provided thread."""
+
+    tracked.pop(threadId, None)
+    deadlines.cancel(threadId)
+
+    store: ThreadStore = plugin.client.get_type_dependency(ThreadStore)
+
+    if archived:
+        store.archive(threadId)
+    else:
+        store.delete(threadId)
+
+
+def scheduler_start(client: GatewayClient) -> None:
+    """
+    Resume archival of the persisted threads, then begin archiving threads
+    as their lifetimes expire.
+    """
+
+    global scheduler
+
+    if scheduler:
+        return
+
+    cfg: Config = client.get_type_dependency(Config)
+    store: ThreadStore = client.get_type_dependency(ThreadStore)
+
+    for record in store.load():
+        # The configuration may have changed since the record was persisted
+        if (record.guild_id != cfg.forums_server) or (
+            record.parent_id not in cfg.forums_channels
         ):
-            logger.debug(
-                f"Skipped thread {title}, author {await expand_user(thread.owner_id, format=False, client=client)} is immune"
-            )
+            store.delete(record.id)
 
             continue
 
+        due: float = record.created_at + cfg.forums_lifetime
+
+        # Keep the later due of a thread awaiting a recheck
+        if record.checked:
+            due = max(due, record.due)
+
+        if due != record.due:
+            record.due = due
+
+            store.save(record)
+
+        tracked[record.id] = record
+
+        deadlines.schedule(record.id, record.due)
+
+    scheduler = asyncio.create_task(task_archive_threads(client))
+
+
+async def scheduler_stop(client: GatewayClient) -> None:
+    """Cancel thread archival and discard all scheduled threads."""
+
+    global scheduler
+
+    if not scheduler:
+        return
+
+    scheduler.cancel()
+
+    try:
+        await scheduler
+    except asyncio.CancelledError:
+        pass
+
+    scheduler = None
+
+    tracked.clear()
+    deadlines.clear()
+
+    client.get_type_dependency(ThreadStore).close()
+
+
+async def task_archive_threads(client: GatewayClient) -> None:
+    """Automatically archive threads in the configured channels."""
+
+    cfg: Config = client.get_type_dependency(Config)
+
+    logger.info(f"Resumed {len(tracked):,} persisted threads to archive")
+
+    await reconcile_threads(client, cfg)
+
+    logger.info(f"Scheduled {len(deadlines):,} threads to archive")
+
+    while True:
+        due: list[ThreadRecord] = [
+            record
+            for threadId in await deadlines.wait()
+            if (record := tracked.pop(threadId, None))
+        ]
+
+        if due:
+            await archive_threads(client, due, cfg)
+
+
+async def reconcile_threads(client: GatewayClient, cfg: Config) -> None:
+    """
+    Discover threads created, and forget threads closed, while no events
+    were received.
+    """
+
+    async with reconciling:
+        started: float = time.time()
+
         try:
-            await client.rest.edit_channel(
-                thread.id,
-                archived=True,
-                reason=f"Maximum lifetime of {lifetime:,}s exceeded.",
-            )
+            active: set[int] = set()
+
+            for thread in await client.rest.fetch_active_threads(cfg.forums_server):
+                active.add(thread.id)
+
+                if thread.id not in tracked:
+                    track_thread(thread, cfg)
+
+            # Threads created since the fetch are absent, yet still active
+            for threadId in [
+                id
+                for id, record in tracked.items()
+                if (id not in active) and (record.created_at < started)
+            ]:
+                untrack_thread(threadId, archived=True)
         except Exception as e:
-            logger.opt(exception=e).error(
-                f"Failed to archive thread {title} in {await expand_server(thread.get_guild(), format=False)}"
-            )
+            logger.opt(exception=e).error("Failed to reconcile active threads")
 
-            continue
+            return
+
+    logger.debug("Reconciled {:,} active threads", len(active))
 
-        await client.rest.create_message(
-            cfg.channels["threads"],
-            log(
-                "thread",
-                f"Archived thread {expand_thread(thread)} with reason: *Maximum lifetime of {lifetime:,}s exceeded.*",
-            ),
+
+async def archive_threads(
+    client: GatewayClient, records: list[ThreadRecord], cfg: Config
+) -> None:
+    """
+    Archive the provided threads concurrently.
+
+    Concurrency is bounded by the archive worker limit, while hikari paces
+    requests according to their rate limit buckets.
+    """
+
+    # Immunity check of each thread author for this batch, keyed by user ID
+    immunity: dict[int, Task[bool]] = {}
+
+    async def worker(record: ThreadRecord) -> None:
+        async with archive_limit:
+            try:
+                archived: bool = await archive_thread(client, record, cfg, immunity)
+            except Exception as e:
+                logger.opt(exception=e).error(
+                    f"Failed to archive thread {expand_thread(record, format=False)}"
+                )
+
+                archived = False
+
+        if archived:
+            client.get_type_dependency(ThreadStore).archive(record.id)
+
+            return
+
+        # Check again later, immunity or failures may be temporary
+        record.due = time.time() + recheck
+
+        schedule_thread(record)
+
+    logger.debug("Archiving {:,} expired threads", len(records))
+
+    await asyncio.gather(*(worker(record) for record in records))
+
+
+async def archive_thread(
+    client: GatewayClient,
+    record: ThreadRecord,
+    cfg: Config,
+    immunity: dict[int, Task[bool]],
+) -> bool:
+    """Archive the provided thread unless its author is immune."""
+
+    title: str = expand_thread(record, format=False)
+    lifetime: int = cfg.forums_lifetime
+
+    check: Task[bool] | None = immunity.get(record.owner_id)
+    immune: bool | None = None
+
+    # Reuse a recent verdict, which may have been persisted before a restart
+    if (not check) and (time.time() - record.checked < recheck):
+        immune = record.immune
+
+    # Threads of the same author share a single in-flight check
+    if (immune is None) and (not check):
+        check = immunity[record.owner_id] = asyncio.create_task(
+            user_has_role(record.owner_id, cfg.forums_immune, record.guild_id, client)
         )
 
-        logger.success(
-            f"Archived thread {title} due to maximum lifetime of {lifetime:,}s exceeded"
+    if check:
+        immune = await check
+
+    record.immune = immune
+    record.checked = time.time()
+
+    if immune:
+        logger.debug(
+            f"Skipped thread {title}, author {await expand_user(Snowflake(record.owner_id), format=False, client=client)} is immune"
         )
-        logger.trace("Sleeping 0.5s to avoid ratelimits...")
 
-        await asyncio.sleep(0.5)
+        return False
+
+    await client.rest.edit_channel(
+        record.id,
+        archived=True,
+        reason=f"Maximum lifetime of {lifetime:,}s exceeded.",
+    )
+
+    client.get_type_dependency(Audit).write(
+        cfg.channels["threads"],
+        log(
+            "thread",
+            f"Archived thread {expand_thread(record)} with reason: *Maximum lifetime of {lifetime:,}s exceeded.*",
+        ),
+    )
+
+    logger.success(
+        f"Archived thread {title} due to maximum lifetime of {lifetime:,}s exceeded"
+    )
 
-    logger.info("Completed recurring task to archive threads")
+    return True
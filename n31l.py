@@ -16,6 +16,7 @@ from hikari import (
 from loguru import logger
 from loguru_discord import DiscordSink
 
+from core.audit import Audit
 from core.config import Config
 from core.hooks import hook_start, hook_stop
 from core.intercept import Intercept
@@ -92,6 +93,7 @@ client: GatewayClient = GatewayClient(
 client.set_type_dependency(GatewayClient, client)
 client.set_type_dependency(GatewayBot, bot)
 client.set_type_dependency(Config, cfg)
+client.set_type_dependency(Audit, Audit())
 
 client.load_extensions_from("extensions")
 